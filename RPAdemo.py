@@ -1,34 +1,33 @@
 import pyautogui
-import time
+
+from rpa_helpers import TEMPLATE_DIR, ScreenLocator
+
+screen = ScreenLocator()
 
       
    
 #mouse operations
 
 #pyautogui.click(100,100)
-#time.sleep(2)
 
 #pyautogui.rightClick(100,100)
-#time.sleep(5)
 
 #pyautogui.doubleClick(100,100)
 
-time.sleep(5)
+# Wait for the target text field instead of a fixed delay, then focus it
+# (falls back to the old 5 s pause until the template has been captured)
+screen.click(f"{TEMPLATE_DIR}/text_field.png", fallback_sleep=5)
            
 #pyautogui.drag(100,100,200,200)
 
 #pyautogui.scroll(-500)
-time.sleep(1)
 
 #keyboard operations
 
 #pyautogui.write("hello priya")
-#time.sleep(2)
 
 
 
 pyautogui.hotkey('ctrl','a')
-time.sleep(3)
 
 pyautogui.press("enter")
-time.sleep(3)
\ No newline at end of file
@@ -0,0 +1,75 @@
+"""
+Startup benchmark for demo.py
+
+Runs `python -X importtime -c "import demo"` in a fresh interpreter and fails
+(exit code 1) if importing the demo takes longer than the budget or pulls in
+any of the heavy modules that should only load behind a menu choice.
+"""
+
+import argparse
+import subprocess
+import sys
+
+# Total cumulative import time allowed for `import demo`, in milliseconds
+DEFAULT_BUDGET_MS = 500
+
+# Top-level packages that must not be imported before the menu renders
+HEAVY_MODULES = [
+    "traditional_rag", "knowledge_graph", "comparison", "load_pdf",
+    "langchain", "langchain_text_splitters", "langchain_community", "langchain_openai",
+    "fitz", "faiss", "neo4j", "graphiti_core", "openai",
+    "matplotlib", "pyvis", "networkx", "numpy", "pandas",
+]
+
+
+def measure(module="demo"):
+    """Returns {top-level module: cumulative import time in ms} for importing module."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+
+    times = {}
+    for line in proc.stderr.splitlines():
+        # "import time:   self [us] |  cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        top = name.strip().split(".")[0]
+        if name.strip() == top and not name.startswith("  "):
+            times[top] = times.get(top, 0) + int(cumulative) / 1000
+        else:
+            times.setdefault(top, 0)
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--module", default="demo")
+    args = parser.parse_args()
+
+    times = measure(args.module)
+    total = times.get(args.module, 0)
+    heavy = sorted(m for m in HEAVY_MODULES if m in times)
+
+    print(f"import {args.module}: {total:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    for name, ms in sorted(times.items(), key=lambda kv: -kv[1])[:10]:
+        print(f"  {name:<28} {ms:8.1f} ms")
+
+    ok = True
+    if total > args.budget_ms:
+        print(f"❌ Over budget by {total - args.budget_ms:.1f} ms")
+        ok = False
+    if heavy:
+        print(f"❌ Heavy modules imported at startup: {', '.join(heavy)}")
+        ok = False
+    if ok:
+        print("✅ Startup within budget")
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,9 @@
 """
 Knowledge Graph vs Traditional RAG Demo
+
+Heavy dependencies (LangChain, FAISS, PyMuPDF, Neo4j, plotting) are imported
+and initialized only when a menu option needs them, so the menu shows up
+immediately. See bench_startup.py for the import-time budget.
 """
 
 import os
@@ -10,16 +14,10 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.prompt import Prompt, Confirm
 
-from traditional_rag import TraditionalRAG
-from knowledge_graph import KnowledgeGraphRAG
-from comparison import compare_systems, run_comparison_suite, plot_comparison_metrics, visualize_graph
-
-from load_pdf import load_pdf
-from langchain_text_splitters import RecursiveCharacterTextSplitter
-from langchain.docstore.document import Document
-
 console = Console()
 
+PDF_PATH = Path("sample_data/NEPQ Black Book of Questions (PLEASE DO NOT SHARE).pdf")
+
 
 DEMO_QUESTIONS = [
     "How does the AuthenticationService relate to the UserManager?",
@@ -54,32 +52,22 @@ def setup_environment():
     return True
 
 
-async def initialize_systems():
-    """Initialize Traditional RAG + Knowledge Graph RAG."""
-    console.print("\n[bold cyan]Initializing Systems...[/bold cyan]\n")
+def _model_config():
+    return {
+        "openai_api_key": os.getenv("OPENAI_API_KEY"),
+        "model_name": os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview"),
+    }
 
-    # Load config
-    openai_api_key = os.getenv("OPENAI_API_KEY")
-    neo4j_uri = os.getenv("NEO4J_URI")
-    neo4j_username = os.getenv("NEO4J_USERNAME")
-    neo4j_password = os.getenv("NEO4J_PASSWORD")
-    model_name = os.getenv("OPENAI_MODEL", "gpt-4-turbo-preview")
-    embedding_model = os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small")
 
-    # Initialize Traditional RAG
-    console.print("[yellow]1. Initializing Traditional RAG...[/yellow]")
-    rag_system = TraditionalRAG(
-        openai_api_key=openai_api_key,
-        model_name=model_name,
-        embedding_model=embedding_model
-    )
-
-    # Load PDF
-    PDF_PATH = Path("sample_data/NEPQ Black Book of Questions (PLEASE DO NOT SHARE).pdf")
+def load_documents():
+    """Load the PDF and split it into LangChain documents (None on failure)."""
+    from load_pdf import load_pdf
+    from langchain_text_splitters import RecursiveCharacterTextSplitter
+    from langchain.docstore.document import Document
 
     if not PDF_PATH.exists():
         console.print(f"[bold red]ERROR: PDF not found at {PDF_PATH}[/bold red]")
-        return None, None
+        return None
 
     console.print(f"[yellow]Loading PDF: {PDF_PATH}[/yellow]")
 
@@ -87,7 +75,7 @@ async def initialize_systems():
         full_text = load_pdf(str(PDF_PATH))
     except Exception as e:
         console.print(f"[bold red]PDF Load Error:[/bold red] {e}")
-        return None, None
+        return None
 
     # -------------------------------
     # CHUNKING USING LANGCHAIN SPLITTER
@@ -110,22 +98,36 @@ async def initialize_systems():
         )
 
     console.print(f"[green]PDF loaded and {len(documents)} chunks created[/green]")
+    return documents
+
+
+def initialize_rag(documents):
+    """Initialize Traditional RAG and build its FAISS index."""
+    from traditional_rag import TraditionalRAG
+
+    console.print("[yellow]Initializing Traditional RAG...[/yellow]")
+    rag_system = TraditionalRAG(
+        embedding_model=os.getenv("OPENAI_EMBEDDING_MODEL", "text-embedding-3-small"),
+        **_model_config()
+    )
 
     # Build FAISS Index
     rag_system.build_index(documents)
     console.print("[green][OK] Traditional RAG initialized[/green]\n")
+    return rag_system
 
-    # -------------------------------
-    # KNOWLEDGE GRAPH RAG
-    # -------------------------------
-    console.print("[yellow]2. Initializing Knowledge Graph RAG...[/yellow]")
+
+async def initialize_kg(get_documents):
+    """Connect Knowledge Graph RAG; get_documents() is only called if the graph must be built."""
+    from knowledge_graph import KnowledgeGraphRAG
+
+    console.print("[yellow]Initializing Knowledge Graph RAG...[/yellow]")
 
     kg_system = KnowledgeGraphRAG(
-        neo4j_uri=neo4j_uri,
-        neo4j_user=neo4j_username,
-        neo4j_password=neo4j_password,
-        openai_api_key=openai_api_key,
-        model_name=model_name
+        neo4j_uri=os.getenv("NEO4J_URI"),
+        neo4j_user=os.getenv("NEO4J_USERNAME"),
+        neo4j_password=os.getenv("NEO4J_PASSWORD"),
+        **_model_config()
     )
 
     await kg_system.graphiti.build_indices_and_constraints()
@@ -143,6 +145,11 @@ async def initialize_systems():
 
     # Build graph if empty
     if stats["total_nodes"] == 0:
+        documents = get_documents()
+        if documents is None:
+            kg_system.close()
+            return None
+
         console.print("[yellow]Building knowledge graph...[/yellow]")
 
         text_blocks = [doc.page_content for doc in documents]
@@ -158,7 +165,42 @@ async def initialize_systems():
     else:
         console.print("[green][OK] Using Existing Knowledge Graph[/green]")
 
-    return rag_system, kg_system
+    return kg_system
+
+
+class Systems:
+    """Builds each subsystem the first time a menu option asks for it."""
+
+    def __init__(self):
+        self._documents = None
+        self.rag_system = None
+        self.kg_system = None
+
+    def documents(self):
+        if self._documents is None:
+            self._documents = load_documents()
+        return self._documents
+
+    def rag(self):
+        if self.rag_system is None:
+            documents = self.documents()
+            if documents is not None:
+                self.rag_system = initialize_rag(documents)
+        return self.rag_system
+
+    async def kg(self):
+        if self.kg_system is None:
+            self.kg_system = await initialize_kg(self.documents)
+        return self.kg_system
+
+    async def both(self):
+        rag_system = self.rag()
+        kg_system = await self.kg() if rag_system else None
+        return rag_system, kg_system
+
+    def close(self):
+        if self.kg_system:
+            self.kg_system.close()
 
 
 async def run_single_comparison(rag_system, kg_system):
@@ -175,6 +217,8 @@ async def run_single_comparison(rag_system, kg_system):
     else:
         question = user_input
 
+    from comparison import compare_systems
+
     await compare_systems(rag_system, kg_system, question, verbose=True)
 
 
@@ -185,13 +229,17 @@ async def run_full_comparison_suite(rag_system, kg_system):
     if not confirm:
         return
 
+    from comparison import run_comparison_suite, plot_comparison_metrics
+
     results = await run_comparison_suite(rag_system, kg_system, DEMO_QUESTIONS)
 
     plot_comparison_metrics(results, "comparison_metrics.png")
     console.print("[green]Saved: comparison_metrics.png[/green]")
 
 
-def visualize_knowledge_graph(kg_system):
+def visualize_knowledge_graph():
+    from comparison import visualize_graph
+
     console.print("\n[bold cyan]Visualizing Graph[/bold cyan]\n")
 
     visualize_graph(
@@ -206,6 +254,8 @@ def visualize_knowledge_graph(kg_system):
 
 
 async def interactive_mode(rag_system, kg_system):
+    from comparison import compare_systems
+
     console.print("\n[bold cyan]Interactive Mode[/bold cyan]")
 
     while True:
@@ -226,9 +276,7 @@ async def main():
     if not setup_environment():
         return
 
-    rag_system, kg_system = await initialize_systems()
-    if not rag_system or not kg_system:
-        return
+    systems = Systems()
 
     while True:
         console.print("\n" + "=" * 80)
@@ -243,22 +291,29 @@ async def main():
 
         choice = Prompt.ask("Choose option", choices=["1", "2", "3", "4", "5", "6"])
 
-        if choice == "1":
-            await run_single_comparison(rag_system, kg_system)
-        elif choice == "2":
-            await run_full_comparison_suite(rag_system, kg_system)
+        if choice in ("1", "2", "4"):
+            rag_system, kg_system = await systems.both()
+            if not rag_system or not kg_system:
+                continue
+            if choice == "1":
+                await run_single_comparison(rag_system, kg_system)
+            elif choice == "2":
+                await run_full_comparison_suite(rag_system, kg_system)
+            else:
+                await interactive_mode(rag_system, kg_system)
         elif choice == "3":
-            visualize_knowledge_graph(kg_system)
-        elif choice == "4":
-            await interactive_mode(rag_system, kg_system)
+            visualize_knowledge_graph()
         elif choice == "5":
+            kg_system = await systems.kg()
+            if not kg_system:
+                continue
             stats = kg_system.get_graph_statistics()
             console.print("\n[bold cyan]Graph Statistics[/bold cyan]")
             for k, v in stats.items():
                 console.print(f"  {k}: {v}")
         elif choice == "6":
             console.print("\n[bold green]Goodbye![/bold green]\n")
-            kg_system.close()
+            systems.close()
             break
 
 
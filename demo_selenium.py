@@ -1,87 +1,215 @@
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-import time
-
-
-# --- Setup WebDriver ---
-driver = webdriver.Chrome(service=Service(ChromeDriverManager().install()))
-driver.maximize_window()
-
-# --- Step 1: Open Website ---
-driver.get("https://opensource-demo.orangehrmlive.com/")
-
-# --- Step 2: Login ---
-wait = WebDriverWait(driver, 10)
-username = wait.until(EC.presence_of_element_located((By.NAME, "username")))
-password = driver.find_element(By.NAME, "password")
-login_button = driver.find_element(By.XPATH, "//button[@type='submit']")
-
-username.send_keys("Admin")
-password.send_keys("admin123")
-login_button.click()
 
-# --- Step 3: Verify Dashboard ---
-wait.until(EC.presence_of_element_located((By.XPATH, "//h6[text()='Dashboard']")))
-print("✅ Logged in successfully and Dashboard loaded.")
+from wait_helpers import WAIT_STATS, WaitStats, element_count_changed, wait_until
 
-# --- Step 4: Navigate to Admin tab ---
-admin_tab = wait.until(EC.element_to_be_clickable((By.XPATH, "//span[text()='Admin']")))
-admin_tab.click()
+BASE_URL = os.getenv("HRM_BASE_URL", "https://opensource-demo.orangehrmlive.com/")
 
-wait.until(EC.presence_of_element_located((By.XPATH, "//h6[text()='System Users']")))
-print("✅ Navigated to Admin tab successfully.")
+# chromedriver is resolved once and remembered here, so later runs work offline
+DRIVER_CACHE_FILE = Path(".drivers/chromedriver_path.txt")
+_driver_lock = threading.Lock()
 
-# --- Step 5: Search for an employee in Admin section ---
-search_box = wait.until(EC.presence_of_element_located((By.XPATH, "//label[text()='Username']/following::input[1]")))
-search_box.send_keys("Admin")
-search_button = driver.find_element(By.XPATH, "//button[normalize-space()='Search']")
-search_button.click()
-print("✅ Performed employee search.")
 
-time.sleep(2)
-
-# --- Step 6: Navigate to PIM and add a new employee ---
-pim_tab = wait.until(EC.element_to_be_clickable((By.XPATH, "//span[text()='PIM']")))
-pim_tab.click()
-
-add_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[normalize-space()='Add']")))
-add_button.click()
-
-# Fill Add Employee form
-first_name = wait.until(EC.presence_of_element_located((By.NAME, "firstName")))
-middle_name = driver.find_element(By.NAME, "middleName")
-last_name = driver.find_element(By.NAME, "lastName")
-
-first_name.send_keys("Priya")
-middle_name.send_keys("R")
-last_name.send_keys("Kumar")
-
-save_button = driver.find_element(By.XPATH, "//button[normalize-space()='Save']")
-save_button.click()
-print("✅ Added new employee successfully.")
-
-# --- Step 7: Navigate to My Info and verify ---
-my_info_tab = wait.until(EC.element_to_be_clickable((By.XPATH, "//span[text()='My Info']")))
-my_info_tab.click()
-
-wait.until(EC.presence_of_element_located((By.XPATH, "//h6[text()='Personal Details']")))
-print("✅ Navigated to My Info successfully.")
-
-# --- Step 8: Logout ---
-user_dropdown = wait.until(EC.element_to_be_clickable((By.XPATH, "//p[@class='oxd-userdropdown-name']")))
-user_dropdown.click()
+# --- Setup WebDriver ---
+def chromedriver_path():
+    """Returns a local chromedriver, downloading it only if no cached copy exists."""
+    with _driver_lock:
+        if os.getenv("CHROMEDRIVER_PATH"):
+            return os.getenv("CHROMEDRIVER_PATH")
+        if DRIVER_CACHE_FILE.exists():
+            cached = DRIVER_CACHE_FILE.read_text().strip()
+            if Path(cached).exists():
+                return cached
+
+        from webdriver_manager.chrome import ChromeDriverManager
+        path = ChromeDriverManager().install()
+        DRIVER_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        DRIVER_CACHE_FILE.write_text(path)
+        return path
+
+
+def make_driver(headless=True):
+    options = webdriver.ChromeOptions()
+    if headless:
+        options.add_argument("--headless=new")
+        options.add_argument("--window-size=1920,1080")
+    options.add_argument("--disable-gpu")
+    driver = webdriver.Chrome(service=Service(chromedriver_path()), options=options)
+    if not headless:
+        driver.maximize_window()
+    return driver
+
 
-logout_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[text()='Logout']")))
-logout_button.click()
+# --- Steps (each takes the driver and a WebDriverWait) ---
+def open_site(driver, wait, base_url=BASE_URL):
+    driver.get(base_url)
+    wait.until(EC.presence_of_element_located((By.NAME, "username")))
 
-wait.until(EC.presence_of_element_located((By.NAME, "username")))
-print("✅ Logged out successfully.")
 
-# --- Close Browser ---
-driver.quit()
-print("🎯 Test Completed Successfully.")
+def login(driver, wait):
+    username = wait.until(EC.presence_of_element_located((By.NAME, "username")))
+    password = driver.find_element(By.NAME, "password")
+    login_button = driver.find_element(By.XPATH, "//button[@type='submit']")
+
+    username.send_keys("Admin")
+    password.send_keys("admin123")
+    login_button.click()
+
+    wait.until(EC.presence_of_element_located((By.XPATH, "//h6[text()='Dashboard']")))
+
+
+def open_admin(driver, wait):
+    admin_tab = wait.until(EC.element_to_be_clickable((By.XPATH, "//span[text()='Admin']")))
+    admin_tab.click()
+    wait.until(EC.presence_of_element_located((By.XPATH, "//h6[text()='System Users']")))
+
+
+def search_admin_user(driver, wait, stats=WAIT_STATS):
+    search_box = wait.until(EC.presence_of_element_located((By.XPATH, "//label[text()='Username']/following::input[1]")))
+    search_box.send_keys("Admin")
+    records_label = (By.XPATH, "//span[contains(normalize-space(), 'Record')]")
+    rows = (By.CSS_SELECTOR, ".oxd-table-body .oxd-table-card")
+    wait_until(driver, EC.presence_of_element_located(records_label), "admin user list", stats)
+    old_rows = driver.find_elements(*rows)
+    search_button = driver.find_element(By.XPATH, "//button[normalize-space()='Search']")
+    search_button.click()
+
+    # The result table is rebuilt when the search returns: wait for the old rows
+    # to go stale (or for rows to appear in an empty table) instead of sleeping
+    if old_rows:
+        wait_until(driver, EC.staleness_of(old_rows[0]), "admin search results", stats)
+    else:
+        wait_until(driver, element_count_changed(rows, 0), "admin search results", stats)
+    wait_until(driver, EC.invisibility_of_element_located((By.CLASS_NAME, "oxd-loading-spinner")),
+               "admin search spinner", stats)
+
+
+def add_employee(driver, wait, first="Priya", middle="R", last="Kumar"):
+    pim_tab = wait.until(EC.element_to_be_clickable((By.XPATH, "//span[text()='PIM']")))
+    pim_tab.click()
+
+    add_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//button[normalize-space()='Add']")))
+    add_button.click()
+
+    first_name = wait.until(EC.presence_of_element_located((By.NAME, "firstName")))
+    middle_name = driver.find_element(By.NAME, "middleName")
+    last_name = driver.find_element(By.NAME, "lastName")
+
+    first_name.send_keys(first)
+    middle_name.send_keys(middle)
+    last_name.send_keys(last)
+
+    save_button = driver.find_element(By.XPATH, "//button[normalize-space()='Save']")
+    save_button.click()
+
+    # Saved once the server answers: success toast or the new employee's details page
+    wait.until(EC.any_of(
+        EC.presence_of_element_located((By.CSS_SELECTOR, ".oxd-toast--success")),
+        EC.presence_of_element_located((By.XPATH, "//h6[text()='Personal Details']")),
+    ))
+
+
+def open_my_info(driver, wait):
+    my_info_tab = wait.until(EC.element_to_be_clickable((By.XPATH, "//span[text()='My Info']")))
+    my_info_tab.click()
+    wait.until(EC.presence_of_element_located((By.XPATH, "//h6[text()='Personal Details']")))
+
+
+def logout(driver, wait):
+    user_dropdown = wait.until(EC.element_to_be_clickable((By.XPATH, "//p[@class='oxd-userdropdown-name']")))
+    user_dropdown.click()
+
+    logout_button = wait.until(EC.element_to_be_clickable((By.XPATH, "//a[text()='Logout']")))
+    logout_button.click()
+    wait.until(EC.presence_of_element_located((By.NAME, "username")))
+
+
+def session_steps(base_url=BASE_URL, stats=WAIT_STATS):
+    """The flow as (name, step) pairs; every step is called as step(driver, wait)."""
+    return [
+        ("open site", partial(open_site, base_url=base_url)),
+        ("login", login),
+        ("admin tab", open_admin),
+        ("admin search", partial(search_admin_user, stats=stats)),
+        ("add employee", add_employee),
+        ("my info", open_my_info),
+        ("logout", logout),
+    ]
+
+
+STEP_NAMES = [name for name, _ in session_steps()]
+
+
+# --- Runner ---
+def run_session(session_id, base_url=BASE_URL, headless=True):
+    """
+    Runs every step in its own browser; returns per-step timings, wait stats and any error.
+
+    Each session keeps its own WaitStats, so a timeout in one session does not
+    raise the wait budgets of the others running alongside it.
+    """
+    stats = WaitStats()
+    result = {"session": session_id, "timings": {}, "waits": stats, "error": None}
+    driver = None
+    try:
+        driver = make_driver(headless)
+        wait = WebDriverWait(driver, 10)
+        for name, step in session_steps(base_url, stats):
+            start = time.perf_counter()
+            step(driver, wait)
+            result["timings"][name] = time.perf_counter() - start
+            print(f"✅ [session {session_id}] {name} ({result['timings'][name]:.2f}s)")
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        print(f"❌ [session {session_id}] failed: {result['error']}")
+    finally:
+        if driver is not None:
+            driver.quit()
+    return result
+
+
+def run_parallel(sessions=1, workers=1, base_url=BASE_URL, headless=True):
+    chromedriver_path()  # resolve once up front instead of racing in every worker
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(lambda i: run_session(i, base_url, headless), range(1, sessions + 1)))
+
+
+def timing_report(results):
+    lines = [f"{'step':<14} {'runs':>5} {'mean s':>8} {'p95 s':>8} {'max s':>8}"]
+    for name in STEP_NAMES:
+        durations = sorted(r["timings"][name] for r in results if name in r["timings"])
+        if not durations:
+            continue
+        p95 = durations[min(len(durations) - 1, int(0.95 * len(durations)))]
+        lines.append(f"{name:<14} {len(durations):>5} {sum(durations) / len(durations):>8.2f} {p95:>8.2f} {durations[-1]:>8.2f}")
+    failed = sum(1 for r in results if r["error"])
+    lines.append(f"\n{len(results) - failed}/{len(results)} sessions completed")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the OrangeHRM flow in one or more browser sessions.")
+    parser.add_argument("--sessions", type=int, default=1)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    results = run_parallel(args.sessions, args.workers, args.base_url, headless=not args.headed)
+    print(f"\n🎯 Finished in {time.perf_counter() - start:.1f}s\n")
+    print(timing_report(results))
+    for result in results:
+        print(f"\nWaits, session {result['session']}:")
+        print(result["waits"].report())
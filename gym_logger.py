@@ -1,14 +1,16 @@
 # gym_logger_streamlit.py
-import sqlite3
 from datetime import datetime, timedelta
 import pandas as pd
 import streamlit as st
 import altair as alt
 
+from unit_converter import convert
+from user_store import connect
+
 DB_NAME = "workout_log.db"
 
-def create_table():
-    conn = sqlite3.connect(DB_NAME)
+def create_table(user_id=None):
+    conn = connect(DB_NAME, user_id)
     c = conn.cursor()
     c.execute("""
         CREATE TABLE IF NOT EXISTS workouts (
@@ -23,10 +25,10 @@ def create_table():
     conn.commit()
     conn.close()
 
-def insert_workout(exercise, sets, reps, weight, date=None):
+def insert_workout(exercise, sets, reps, weight, date=None, user_id=None):
     if not date:
         date = datetime.now().strftime("%Y-%m-%d")
-    conn = sqlite3.connect(DB_NAME)
+    conn = connect(DB_NAME, user_id)
     c = conn.cursor()
     c.execute("INSERT INTO workouts (date, exercise, sets, reps, weight) VALUES (?, ?, ?, ?, ?)",
               (date, exercise, int(sets), int(reps), float(weight)))
@@ -34,8 +36,8 @@ def insert_workout(exercise, sets, reps, weight, date=None):
     conn.close()
 
 @st.cache_data
-def load_df():
-    conn = sqlite3.connect(DB_NAME)
+def load_df(user_id=None):
+    conn = connect(DB_NAME, user_id)
     df = pd.read_sql_query("SELECT * FROM workouts ORDER BY date DESC, id DESC", conn)
     conn.close()
     if not df.empty:
@@ -44,7 +46,10 @@ def load_df():
 
 # ---- Streamlit layout ----
 st.set_page_config(page_title="Gym Logger", layout="centered")
-create_table()
+
+# Each user's workouts live in their own shard file
+user_id = st.sidebar.text_input("User", help="Leave blank to use the shared log").strip() or None
+create_table(user_id)
 
 st.header("🏋️ Gym Workout Logger")
 
@@ -56,19 +61,23 @@ with col1:
         ex = st.text_input("Exercise (e.g. Bench Press)")
         sets = st.number_input("Sets", min_value=1, max_value=20, value=3, step=1)
         reps = st.number_input("Reps", min_value=1, max_value=100, value=8, step=1)
-        weight = st.number_input("Weight (kg)", min_value=0.0, value=20.0, step=0.5, format="%.1f")
+        weight = st.number_input("Weight", min_value=0.0, value=20.0, step=0.5, format="%.1f")
+        weight_unit = st.radio("Unit", ["kg", "lb"], horizontal=True)
         submitted = st.form_submit_button("Add Workout")
         if submitted:
             if not ex.strip():
                 st.warning("Please enter an exercise name.")
             else:
-                insert_workout(ex.strip(), sets, reps, weight)
+                # Weights are always stored in kg
+                weight_kg = round(convert(weight, weight_unit, "kg"), 2)
+                insert_workout(ex.strip(), sets, reps, weight_kg, user_id=user_id)
+                load_df.clear()
                 st.success("Logged workout.")
                 st.experimental_rerun()
 
 with col2:
     st.markdown("**Quick Stats**")
-    df = load_df()
+    df = load_df(user_id)
     total_entries = 0 if df.empty else len(df)
     st.metric("Total entries", total_entries)
     if not df.empty:
@@ -78,7 +87,7 @@ with col2:
 st.markdown("---")
 
 # Filters and view
-df = load_df()
+df = load_df(user_id)
 exercises = sorted(df['exercise'].unique().tolist()) if not df.empty else []
 filter_cols = st.columns([2,1,1])
 
@@ -146,4 +155,4 @@ with chart_cols[1]:
     plot_progress(df_month, f"Last 30 days — {sel_ex}")
 
 st.markdown("---")
-st.caption("Works offline using local SQLite DB (workout_log.db). On Streamlit Cloud, the app will be ephemeral unless you mount persistent storage.")
+st.caption("Works offline using local SQLite DB (workout_log.db, one file per user under user_data/). On Streamlit Cloud, the app will be ephemeral unless you mount persistent storage.")
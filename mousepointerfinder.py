@@ -2,6 +2,4 @@ import pyautogui
 
 x,y=pyautogui.position()
 
-print(f'x' :{x}, y :{y}')
-      
-      
\ No newline at end of file
+print(f'x :{x}, y :{y}')
@@ -1,35 +1,153 @@
+import argparse
 import asyncio
 from playwright.async_api import async_playwright
 
-async def scrape_reddit_questions():
+import scrape_store
+from wait_helpers import pw_wait_for_selector
+
+BASE_URL = "https://old.reddit.com"
+
+# Page resources we never need for scraping titles
+BLOCKED_RESOURCES = {"image", "stylesheet", "font", "media"}
+
+# Pulls every post on a listing page in a single round trip
+EXTRACT_POSTS_JS = """
+things => things.map(t => {
+    const link = t.querySelector('a.title');
+    return {
+        id: t.getAttribute('data-fullname'),
+        title: link ? link.innerText.trim() : '',
+        url: link ? link.href : null,
+        permalink: t.getAttribute('data-permalink')
+            ? new URL(t.getAttribute('data-permalink'), location.href).href
+            : null,
+    };
+})
+"""
+
+
+def listing_url(subreddit, sort="top", window="all", base_url=BASE_URL):
+    return f"{base_url}/r/{subreddit}/{sort}/?t={window}"
+
+
+def is_chronological(url):
+    """Only /new/ listings are ordered newest first, so only they can stop at a known post."""
+    return "/new/" in url
+
+
+async def block_heavy_resources(route):
+    if route.request.resource_type in BLOCKED_RESOURCES:
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def scrape_listing(page, url, max_pages=5, stop_at=None):
+    """
+    Follows old-reddit "next" links from url and returns every post seen.
+
+    If stop_at is given (the newest post id seen on this listing last time),
+    only posts before it are returned and pagination stops there.
+    """
+    posts = []
+    for _ in range(max_pages):
+        await page.goto(url, wait_until="domcontentloaded")
+        await pw_wait_for_selector(page, "#siteTable", "reddit listing", state="attached")
+        page_posts = await page.eval_on_selector_all("div.thing[data-fullname]", EXTRACT_POSTS_JS)
+
+        ids = [post["id"] for post in page_posts]
+        if stop_at and stop_at in ids:
+            posts.extend(page_posts[:ids.index(stop_at)])
+            break
+        posts.extend(page_posts)
+
+        next_link = await page.query_selector("span.next-button a")
+        if not next_link:
+            break
+        url = await next_link.evaluate("a => a.href")
+    return posts
+
+
+async def scrape_listings(urls, pool_size=4, max_pages=5, headless=False, user_data_dir="./reddit_user_data",
+                          stop_at=None):
+    """
+    Scrapes many listing URLs with a bounded pool of pages.
+
+    All pages share one persistent browser context, so cookies and the
+    connection pool are reused; each worker pulls the next URL off a queue.
+    stop_at maps a URL to the post id where its pagination should stop.
+    Returns {url: [post, ...]}.
+    """
+    stop_at = stop_at or {}
+    queue = asyncio.Queue()
+    for url in urls:
+        queue.put_nowait(url)
+    results = {}
+
     async with async_playwright() as p:
         # ✅ Use persistent user data dir to look human
-        browser = await p.chromium.launch_persistent_context(
-            user_data_dir="./reddit_user_data",
-            headless=False,
-            args=["--start-maximized"]
+        context = await p.chromium.launch_persistent_context(
+            user_data_dir=user_data_dir,
+            headless=headless,
         )
-        page = await browser.new_page()
+        await context.route("**/*", block_heavy_resources)
+
+        async def worker():
+            page = await context.new_page()
+            while not queue.empty():
+                url = queue.get_nowait()
+                try:
+                    results[url] = await scrape_listing(page, url, max_pages, stop_at.get(url))
+                except Exception as e:
+                    print(f"⚠️ Failed to scrape {url}: {e}")
+                    results[url] = []
+            await page.close()
 
-        await page.goto("https://old.reddit.com/r/workingmoms/top/?t=all", wait_until="networkidle")
+        await asyncio.gather(*(worker() for _ in range(max(1, min(pool_size, len(urls))))))
+        await context.close()
 
-        print("Opened old Reddit in persistent user mode.")
-        await page.wait_for_timeout(5000)
+    return results
 
-        # Scroll and scrape
-        for _ in range(3):
-            await page.mouse.wheel(0, 4000)
-            await page.wait_for_timeout(2000)
 
-        titles = await page.query_selector_all('a.title')
-        questions = [await t.inner_text() for t in titles if (await t.inner_text()).strip().endswith("?")]
+async def scrape_reddit_questions(subreddits=("workingmoms",), sorts=("new",), windows=("all",), pool_size=4,
+                                  max_pages=5, headless=False, base_url=BASE_URL,
+                                  output_file="workingmoms_questions.txt", db_name=scrape_store.DB_NAME):
+    """
+    Scrapes the listings into the scrape store, then re-exports the full
+    question set from the store to output_file.
 
-        with open("workingmoms_questions.txt", "w", encoding="utf-8") as f:
-            f.write("\n".join(questions))
+    The default is the "new" listing: it stops at the newest post stored for
+    it on the previous run, so a daily refresh costs time proportional to the
+    new posts only. Ranked listings such as "top" have no such stopping point
+    and are re-read up to max_pages every time, so pass sorts=("top",) only
+    for an occasional backfill.
+    """
+    scrape_store.create_tables(db_name)
+    urls = [listing_url(sub, sort, w, base_url) for sub in subreddits for sort in sorts for w in windows]
+    stop_at = {url: scrape_store.newest_id(url, db_name) for url in urls if is_chronological(url)}
+    results = await scrape_listings(urls, pool_size=pool_size, max_pages=max_pages, headless=headless,
+                                    stop_at=stop_at)
 
-        print(f"✅ Scraped {len(questions)} questions and saved.")
+    added = 0
+    for url in urls:
+        posts = results[url]
+        newest = posts[0]["id"] if posts and is_chronological(url) else None
+        added += scrape_store.save_posts(url, posts, newest, db_name)
+    total = scrape_store.export_questions(output_file, db_name)
+
+    print(f"✅ Stored {added} new posts from {len(urls)} listings; exported {total} questions.")
 
-        await browser.close()
 
 if __name__ == "__main__":
-    asyncio.run(scrape_reddit_questions())
+    parser = argparse.ArgumentParser(description="Scrape question titles from old-reddit listings.")
+    parser.add_argument("subreddits", nargs="*", default=["workingmoms"])
+    parser.add_argument("--sort", dest="sorts", action="append", choices=["new", "top", "hot", "controversial"],
+                        help="listing to scrape; repeatable (default: new, which refreshes incrementally)")
+    parser.add_argument("--window", dest="windows", action="append",
+                        help="time window for ranked listings; repeatable (default: all)")
+    parser.add_argument("--max-pages", type=int, default=5)
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+
+    asyncio.run(scrape_reddit_questions(args.subreddits, args.sorts or ["new"], args.windows or ["all"],
+                                        max_pages=args.max_pages, headless=args.headless))
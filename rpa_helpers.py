@@ -0,0 +1,118 @@
+# rpa_helpers.py
+"""
+Template-matching helpers for the pyautogui scripts.
+
+Targets are found by matching a small screenshot of the UI element (a
+"template", e.g. rpa_templates/send_button.png) instead of hard-coded
+coordinates. The last place each template was found is cached and checked
+first, and waits poll at a short interval instead of sleeping for a fixed time.
+
+Matching is done with pyscreeze, so it also runs on static screenshots
+without a display; pyautogui is only imported to grab the screen or click.
+"""
+import os
+import time
+
+import pyscreeze
+
+TEMPLATE_DIR = "rpa_templates"
+
+
+def _grab_screen():
+    import pyautogui
+    return pyautogui.screenshot()
+
+
+class ScreenLocator:
+    def __init__(self, poll_interval=0.2, timeout=15.0, confidence=None, screenshot=None, margin=20):
+        """
+        confidence: match threshold (needs opencv-python); None means exact match.
+        screenshot: callable returning a PIL image of the screen; defaults to
+                    pyautogui.screenshot, and can be replaced with a static image.
+        margin:     pixels around a cached box that are searched before a full search.
+        """
+        self.poll_interval = poll_interval
+        self.timeout = timeout
+        self.confidence = confidence
+        self.screenshot = screenshot or _grab_screen
+        self.margin = margin
+        self.cache = {}
+        self.hits = 0
+        self.misses = 0
+
+    def _match(self, template, haystack, region):
+        kwargs = {"region": region, "grayscale": True}
+        if self.confidence is not None:
+            kwargs["confidence"] = self.confidence
+        try:
+            return pyscreeze.locate(template, haystack, **kwargs)
+        except pyscreeze.ImageNotFoundException:
+            # Newer pyscreeze versions raise instead of returning None
+            return None
+
+    def _around(self, box, width, height):
+        left = max(0, box.left - self.margin)
+        top = max(0, box.top - self.margin)
+        right = min(width, box.left + box.width + self.margin)
+        bottom = min(height, box.top + box.height + self.margin)
+        return (left, top, right - left, bottom - top)
+
+    def locate(self, template, region=None):
+        """One search: the cached area first, then region (or the whole screen)."""
+        haystack = self.screenshot()
+        cached = self.cache.get(template)
+        if cached:
+            box = self._match(template, haystack, self._around(cached, *haystack.size))
+            if box:
+                self.hits += 1
+                self.cache[template] = box
+                return box
+
+        self.misses += 1
+        box = self._match(template, haystack, region)
+        if box:
+            self.cache[template] = box
+        return box
+
+    def wait_for(self, template, region=None, timeout=None, fallback_sleep=None):
+        """
+        Polls until template is on screen; raises TimeoutError otherwise.
+
+        If the template image has not been captured yet and fallback_sleep is
+        given, sleeps that long instead (the old fixed delay) and returns None.
+        """
+        if not os.path.exists(template):
+            if fallback_sleep is None:
+                raise FileNotFoundError(f"{template} not found; capture it with rpa_helpers.capture_template")
+            print(f"⚠️ {template} not found, waiting {fallback_sleep}s instead "
+                  f"(capture it with rpa_helpers.capture_template)")
+            time.sleep(fallback_sleep)
+            return None
+
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        while True:
+            box = self.locate(template, region)
+            if box:
+                return box
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"{template} did not appear on screen")
+            time.sleep(self.poll_interval)
+
+    def click(self, template, region=None, timeout=None, fallback_sleep=None, fallback_xy=None):
+        """Waits for template and clicks its centre; without the template, clicks fallback_xy if given."""
+        import pyautogui
+
+        box = self.wait_for(template, region, timeout, fallback_sleep)
+        if box:
+            pyautogui.click(pyscreeze.center(box))
+        elif fallback_xy:
+            pyautogui.click(*fallback_xy)
+        return box
+
+
+def capture_template(path, region):
+    """Saves the (left, top, width, height) region of the screen as a template image."""
+    import pyautogui
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    pyautogui.screenshot(path, region=region)
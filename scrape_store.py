@@ -0,0 +1,90 @@
+# scrape_store.py
+import sqlite3
+from datetime import datetime
+
+DB_NAME = "reddit_scrape.db"
+
+
+# -------------------------- Database Setup --------------------------
+def create_tables(db_name=DB_NAME):
+    conn = sqlite3.connect(db_name)
+    c = conn.cursor()
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS posts (
+            id TEXT PRIMARY KEY,
+            listing TEXT,
+            title TEXT,
+            url TEXT,
+            permalink TEXT,
+            first_seen TEXT
+        )
+    """)
+    # Key posts on the reddit permalink: different posts may share a link target
+    c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_posts_permalink ON posts (permalink)")
+    # Newest post seen on each chronological listing, as of the last run
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS listings (
+            listing TEXT PRIMARY KEY,
+            newest_id TEXT,
+            last_run TEXT
+        )
+    """)
+    conn.commit()
+    conn.close()
+
+
+# -------------------------- Core Functions --------------------------
+def save_posts(listing, posts, newest=None, db_name=DB_NAME):
+    """
+    Inserts new posts (duplicates by id or permalink are ignored); returns the number added.
+
+    newest is the id of the newest post on a chronological listing; when
+    given it replaces the stored marker for that listing.
+    """
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    conn = sqlite3.connect(db_name)
+    c = conn.cursor()
+    before = conn.total_changes
+    c.executemany(
+        "INSERT OR IGNORE INTO posts (id, listing, title, url, permalink, first_seen) VALUES (?, ?, ?, ?, ?, ?)",
+        [(p["id"], listing, p["title"], p["url"] or None, p.get("permalink") or None, now) for p in posts if p["id"]],
+    )
+    added = conn.total_changes - before
+    c.execute("""
+        INSERT INTO listings (listing, newest_id, last_run) VALUES (?, ?, ?)
+        ON CONFLICT(listing) DO UPDATE SET
+            newest_id = COALESCE(excluded.newest_id, listings.newest_id),
+            last_run = excluded.last_run
+    """, (listing, newest, now))
+    conn.commit()
+    conn.close()
+    return added
+
+
+def newest_id(listing, db_name=DB_NAME):
+    conn = sqlite3.connect(db_name)
+    c = conn.cursor()
+    c.execute("SELECT newest_id FROM listings WHERE listing = ?", (listing,))
+    row = c.fetchone()
+    conn.close()
+    return row[0] if row else None
+
+
+def iter_questions(db_name=DB_NAME):
+    """Yields stored titles ending in '?', oldest first, without loading them all."""
+    conn = sqlite3.connect(db_name)
+    try:
+        for (title,) in conn.execute("SELECT title FROM posts WHERE title LIKE '%?' ORDER BY first_seen, rowid"):
+            yield title
+    finally:
+        conn.close()
+
+
+def export_questions(output_file, db_name=DB_NAME):
+    """Streams every stored question to output_file; returns how many were written."""
+    count = 0
+    with open(output_file, "w", encoding="utf-8") as f:
+        for title in iter_questions(db_name):
+            f.write(("\n" if count else "") + title)
+            count += 1
+    return count
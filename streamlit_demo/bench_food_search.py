@@ -0,0 +1,79 @@
+"""
+Latency benchmark for the ingredient typeahead
+
+Builds an IngredientIndex over a synthetic catalog (500k foods by default) and
+fails (exit code 1) if any sample query takes longer than the budget to return
+its top matches.
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from food_search import IngredientIndex
+
+# Worst allowed time for one search, in milliseconds
+DEFAULT_BUDGET_MS = 10
+
+WORDS = [
+    "chicken", "breast", "thigh", "rice", "brown", "white", "egg", "oats", "milk", "whole",
+    "skim", "apple", "banana", "broccoli", "olive", "oil", "peanut", "butter", "almond",
+    "cheddar", "cheese", "greek", "yogurt", "salmon", "tuna", "beef", "ground", "pork",
+    "bread", "wheat", "rye", "pasta", "tomato", "sauce", "spinach", "kale", "carrot",
+    "potato", "sweet", "bean", "black", "kidney", "lentil", "red", "green", "onion",
+    "garlic", "pepper", "bell", "corn", "pea", "raw", "cooked", "fried", "roasted",
+]
+
+# Prefixes, full names, substrings, typos and a miss
+QUERIES = [
+    "c", "ch", "chi", "chicken", "chicken br", "olive oil", "greek yog",
+    "brest", "yogurt", "butter", "chiken brest", "brocoli", "penut buter", "salmn",
+    "peanut butter 12", "zzzz",
+]
+
+
+def synthetic_catalog(n, seed=0):
+    """n distinct names built from common food words."""
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(WORDS) for _ in range(rng.randint(2, 4))) + f" {i}" for i in range(n)]
+
+
+def measure(index, queries=QUERIES, limit=20, repeat=5):
+    """Returns {query: best of `repeat` search times in ms}."""
+    times = {}
+    for query in queries:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            index.search(query, limit)
+            best = min(best, time.perf_counter() - start)
+        times[query] = best * 1000
+    return times
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--foods", type=int, default=500_000)
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS)
+    parser.add_argument("--limit", type=int, default=20)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    index = IngredientIndex(synthetic_catalog(args.foods))
+    print(f"Indexed {len(index)} foods in {time.perf_counter() - start:.1f} s")
+
+    times = measure(index, limit=args.limit)
+    for query, ms in times.items():
+        print(f"  {query!r:<22} {ms:8.2f} ms")
+
+    slow = [q for q, ms in times.items() if ms > args.budget_ms]
+    if slow:
+        print(f"❌ Over the {args.budget_ms:.0f} ms budget: {', '.join(map(repr, slow))}")
+        return 1
+    print(f"✅ Every query within {args.budget_ms:.0f} ms (worst {max(times.values()):.2f} ms)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,17 @@
+import os
+import sys
+from pathlib import Path
+
 import streamlit as st
-import pandas as pd
-from datetime import datetime
+from datetime import datetime, date as date_cls
+
+# Shared helpers live in the repository root
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+from user_store import connect
+from unit_converter import ConversionError
+from food_db import FoodDB, MealLog
+
+DB_NAME = "calorie_log.db"
 
 # --- Page Config ---
 st.set_page_config(page_title="Smart Calorie Tracker", page_icon="🥗", layout="centered")
@@ -8,31 +19,95 @@ st.set_page_config(page_title="Smart Calorie Tracker", page_icon="🥗", layout=
 st.title("🥗 Smart Calorie & Macro Tracker")
 st.write("Track your meals with automatic calorie estimation based on ingredients and measurements!")
 
-# --- Mock Ingredient Calorie Database (per unit) ---
+# --- Mock Ingredient Calorie Database ---
 # These are average estimates (you can expand or connect to an API like Edamam or Nutritionix)
+# "per" is the serving the values refer to; density (g/ml) and piece_weight (g)
+# let any measurement be converted onto that serving.
 FOOD_DB = {
-    "Chicken Breast": {"cal": 165, "protein": 31, "carbs": 0, "fat": 3.6},
-    "Rice (cooked)": {"cal": 206, "protein": 4.3, "carbs": 45, "fat": 0.4},
-    "Egg": {"cal": 78, "protein": 6, "carbs": 0.6, "fat": 5},
-    "Oats": {"cal": 150, "protein": 5, "carbs": 27, "fat": 3},
-    "Milk": {"cal": 103, "protein": 8, "carbs": 12, "fat": 2.4},
-    "Apple": {"cal": 95, "protein": 0.5, "carbs": 25, "fat": 0.3},
-    "Banana": {"cal": 105, "protein": 1.3, "carbs": 27, "fat": 0.3},
-    "Broccoli": {"cal": 55, "protein": 4.7, "carbs": 11, "fat": 0.6},
-    "Olive Oil": {"cal": 119, "protein": 0, "carbs": 0, "fat": 13.5},
-    "Peanut Butter": {"cal": 188, "protein": 8, "carbs": 6, "fat": 16},
+    "Chicken Breast": {"cal": 165, "protein": 31, "carbs": 0, "fat": 3.6, "per": (100, "g"), "piece_weight": 174},
+    "Rice (cooked)": {"cal": 206, "protein": 4.3, "carbs": 45, "fat": 0.4, "per": (1, "cup"), "density": 0.67},
+    "Egg": {"cal": 78, "protein": 6, "carbs": 0.6, "fat": 5, "per": (1, "piece"), "piece_weight": 50},
+    "Oats": {"cal": 150, "protein": 5, "carbs": 27, "fat": 3, "per": (40, "g"), "density": 0.34},
+    "Milk": {"cal": 103, "protein": 8, "carbs": 12, "fat": 2.4, "per": (1, "cup"), "density": 1.03},
+    "Apple": {"cal": 95, "protein": 0.5, "carbs": 25, "fat": 0.3, "per": (1, "piece"), "piece_weight": 182},
+    "Banana": {"cal": 105, "protein": 1.3, "carbs": 27, "fat": 0.3, "per": (1, "piece"), "piece_weight": 118},
+    "Broccoli": {"cal": 55, "protein": 4.7, "carbs": 11, "fat": 0.6, "per": (1, "cup"), "density": 0.66},
+    "Olive Oil": {"cal": 119, "protein": 0, "carbs": 0, "fat": 13.5, "per": (1, "tbsp"), "density": 0.91},
+    "Peanut Butter": {"cal": 188, "protein": 8, "carbs": 6, "fat": 16, "per": (2, "tbsp"), "density": 1.08},
 }
 
-MEASURE_CONVERSION = {
-    "cup": 1,
-    "tablespoon": 0.0625,
-    "teaspoon": 0.0208,
-    "piece": 1
-}
+# Set FOOD_DB_PATH to a CSV (name, cal, protein, carbs, fat) to use a full catalog
+@st.cache_resource
+def load_food_db(path=None):
+    if path:
+        return FoodDB.from_csv(path)
+    return FoodDB.from_dict(FOOD_DB)
+
+
+food_db = load_food_db(os.getenv("FOOD_DB_PATH"))
+
+MEASURES = ["g", "oz", "cup", "tbsp", "tsp", "ml", "piece"]
+
+# --- Persistent Meal Log (one SQLite shard per user) ---
+def create_table(user_id=None):
+    conn = connect(DB_NAME, user_id)
+    c = conn.cursor()
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS meals (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            date TEXT,
+            meal_type TEXT,
+            ingredient TEXT,
+            quantity TEXT,
+            calories REAL,
+            protein REAL,
+            carbs REAL,
+            fat REAL
+        )
+    """)
+    conn.commit()
+    conn.close()
+
+
+def insert_entry(log, row, user_id=None):
+    """Persists row `row` of the in-memory meal log."""
+    conn = connect(DB_NAME, user_id)
+    c = conn.cursor()
+    c.execute(
+        "INSERT INTO meals (date, meal_type, ingredient, quantity, calories, protein, carbs, fat) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (log.dates[row].isoformat(), log.meal_types[row], log.ingredients[row], log.quantities[row],
+         *log.nutrients[row].tolist()),
+    )
+    conn.commit()
+    conn.close()
+
+
+def load_entries(user_id=None):
+    conn = connect(DB_NAME, user_id)
+    c = conn.cursor()
+    c.execute("SELECT date, meal_type, ingredient, quantity, calories, protein, carbs, fat FROM meals ORDER BY id")
+    rows = c.fetchall()
+    conn.close()
+    log = MealLog(capacity=max(64, len(rows)))
+    for d, meal_type, ingredient, quantity, *nutrients in rows:
+        log.append(date_cls.fromisoformat(d), meal_type, ingredient, quantity, nutrients)
+    return log
+
+
+def clear_entries(user_id=None):
+    conn = connect(DB_NAME, user_id)
+    conn.execute("DELETE FROM meals")
+    conn.commit()
+    conn.close()
+
 
 # --- Initialize session state ---
-if "entries" not in st.session_state:
-    st.session_state.entries = []
+user_id = st.sidebar.text_input("👤 User", help="Leave blank to use the shared log").strip() or None
+if "entries" not in st.session_state or st.session_state.get("user_id") != user_id:
+    create_table(user_id)
+    st.session_state.user_id = user_id
+    st.session_state.entries = load_entries(user_id)
 
 # --- Sidebar: Daily Goals ---
 st.sidebar.header("🎯 Daily Nutrition Goals")
@@ -45,47 +120,39 @@ fats_goal = st.sidebar.number_input("Fats Goal (g)", min_value=0, value=70, step
 st.header("🍽️ Add a Meal")
 
 meal_category = st.selectbox("Meal Category", ["Breakfast", "Lunch", "Dinner"])
-ingredient = st.selectbox("Select Ingredient", list(FOOD_DB.keys()))
+ingredient_query = st.text_input("Search Ingredient", placeholder="Start typing, e.g. chick")
+ingredient = st.selectbox("Select Ingredient", food_db.search(ingredient_query))
 quantity = st.number_input("Quantity", min_value=0.0, step=0.5)
-measure = st.selectbox("Measurement", list(MEASURE_CONVERSION.keys()))
+measure = st.selectbox("Measurement", MEASURES)
 date = st.date_input("Date", datetime.now())
 
 if st.button("➕ Add Ingredient"):
-    if quantity > 0:
-        conv_factor = MEASURE_CONVERSION[measure]
-        cal_data = FOOD_DB[ingredient]
-        calories = round(cal_data["cal"] * quantity * conv_factor, 1)
-        protein = round(cal_data["protein"] * quantity * conv_factor, 1)
-        carbs = round(cal_data["carbs"] * quantity * conv_factor, 1)
-        fat = round(cal_data["fat"] * quantity * conv_factor, 1)
-
-        entry = {
-            "Date": date,
-            "Meal Type": meal_category,
-            "Ingredient": ingredient,
-            "Quantity": f"{quantity} {measure}",
-            "Calories": calories,
-            "Protein (g)": protein,
-            "Carbs (g)": carbs,
-            "Fats (g)": fat,
-        }
-
-        st.session_state.entries.append(entry)
-        st.success(f"✅ Added {ingredient} ({calories} kcal)")
+    if not ingredient:
+        st.warning("No ingredient matches your search.")
+    elif quantity > 0:
+        rows = food_db.rows([ingredient])
+        try:
+            servings = food_db.servings(rows, [quantity], [measure])
+        except ConversionError as e:
+            st.warning(f"Can't measure {ingredient} in {measure}: {e}")
+        else:
+            nutrients = food_db.scale(rows, servings)[0].round(1)
+
+            log = st.session_state.entries
+            log.append(date, meal_category, ingredient, f"{quantity} {measure}", nutrients)
+            insert_entry(log, len(log) - 1, user_id)
+            st.success(f"✅ Added {ingredient} ({nutrients[0]} kcal)")
     else:
         st.warning("Please enter a valid quantity.")
 
 # --- Display Meal Log ---
-if st.session_state.entries:
+if len(st.session_state.entries):
     st.header("📊 Meal Log")
-    df = pd.DataFrame(st.session_state.entries)
+    df = st.session_state.entries.to_frame()
     st.dataframe(df, use_container_width=True)
 
     # --- Summary ---
-    total_cal = df["Calories"].sum()
-    total_protein = df["Protein (g)"].sum()
-    total_carbs = df["Carbs (g)"].sum()
-    total_fats = df["Fats (g)"].sum()
+    total_cal, total_protein, total_carbs, total_fats = st.session_state.entries.totals()
 
     st.subheader("📈 Daily Summary")
     col1, col2, col3, col4 = st.columns(4)
@@ -100,7 +167,8 @@ if st.session_state.entries:
     st.bar_chart(meal_summary)
 
     if st.button("🗑️ Clear All Entries"):
-        st.session_state.entries = []
+        clear_entries(user_id)
+        st.session_state.entries.clear()
         st.warning("All entries cleared!")
 else:
     st.info("No meal entries yet. Add ingredients above to get started!")
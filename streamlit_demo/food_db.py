@@ -0,0 +1,166 @@
+# food_db.py
+import numpy as np
+import pandas as pd
+
+from food_search import IngredientIndex
+from unit_converter import convert_many, register_food
+
+NUTRIENTS = ["cal", "protein", "carbs", "fat"]
+
+# Nutrition catalogs are usually given per 100 g
+DEFAULT_SERVING = (100.0, "g")
+
+
+def _value(column, i):
+    """Entry i of an optional column, or None when the column or value is missing."""
+    if column is None or pd.isna(column[i]):
+        return None
+    return column[i]
+
+
+class FoodDB:
+    """
+    Columnar food database.
+
+    Names are kept in one array and nutrients in an (n_foods, 4) float matrix,
+    so looking up and scaling many foods at once is a single NumPy operation.
+    Nutrients are given per serving (serving_qty of serving_unit); densities
+    and piece weights are registered with unit_converter so any measure can
+    be mapped onto that serving.
+    """
+
+    def __init__(self, names, matrix, serving_qty=None, serving_unit=None,
+                 density=None, piece_weight=None):
+        self.names = np.asarray(names, dtype=object)
+        n = len(self.names)
+        self.matrix = np.asarray(matrix, dtype=np.float64).reshape(n, len(NUTRIENTS))
+        if serving_qty is None:
+            serving_qty = np.full(n, DEFAULT_SERVING[0])
+        if serving_unit is None:
+            serving_unit = np.full(n, DEFAULT_SERVING[1], dtype=object)
+        self.serving_qty = np.asarray(serving_qty, dtype=np.float64)
+        self.serving_unit = np.asarray(serving_unit, dtype=object)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.search_index = IngredientIndex(self.names)
+
+        for i, name in enumerate(self.names):
+            d, p = _value(density, i), _value(piece_weight, i)
+            if d or p:
+                register_food(name, density=d, piece_weight=p)
+
+    @classmethod
+    def from_dict(cls, food_dict):
+        names = list(food_dict.keys())
+        matrix = [[food_dict[n][k] for k in NUTRIENTS] for n in names]
+        per = [food_dict[n].get("per", DEFAULT_SERVING) for n in names]
+        return cls(
+            names, matrix,
+            serving_qty=[q for q, _ in per],
+            serving_unit=[u for _, u in per],
+            density=[food_dict[n].get("density") for n in names],
+            piece_weight=[food_dict[n].get("piece_weight") for n in names],
+        )
+
+    @classmethod
+    def from_csv(cls, path):
+        """
+        Loads a CSV with columns: name, cal, protein, carbs, fat.
+
+        Optional columns: serving_qty, serving_unit (default 100 g),
+        density (g/ml) and piece_weight (g).
+        """
+        df = pd.read_csv(path)
+        df = df.drop_duplicates("name")
+
+        def column(name):
+            return df[name].to_numpy() if name in df else None
+
+        return cls(
+            df["name"].to_numpy(dtype=object), df[NUTRIENTS].to_numpy(dtype=np.float64),
+            serving_qty=column("serving_qty"), serving_unit=column("serving_unit"),
+            density=column("density"), piece_weight=column("piece_weight"),
+        )
+
+    def __len__(self):
+        return len(self.names)
+
+    def rows(self, names):
+        return np.fromiter((self.index[n] for n in names), dtype=np.intp, count=len(names))
+
+    def servings(self, rows, quantities, units):
+        """Number of servings for each (row, quantity, unit), converted in one batch."""
+        rows = np.asarray(rows, dtype=np.intp)
+        amounts = convert_many(quantities, units, self.serving_unit[rows], self.names[rows])
+        return amounts / self.serving_qty[rows]
+
+    def scale(self, rows, servings):
+        """Per-item nutrients: one (len(rows), 4) array for all items at once."""
+        return np.asarray(servings, dtype=np.float64)[:, None] * self.matrix[rows]
+
+    def search(self, query, limit=20):
+        """Typeahead lookup of food names, see IngredientIndex.search."""
+        return self.search_index.search(query, limit)
+
+
+class MealLog:
+    """
+    Typed columnar meal log that grows in place.
+
+    Columns are preallocated NumPy arrays that double in size when full, so
+    adding an entry does not rebuild the whole table.
+    """
+
+    COLUMNS = ["Date", "Meal Type", "Ingredient", "Quantity",
+               "Calories", "Protein (g)", "Carbs (g)", "Fats (g)"]
+
+    def __init__(self, capacity=64):
+        self.size = 0
+        self.dates = np.empty(capacity, dtype=object)
+        self.meal_types = np.empty(capacity, dtype=object)
+        self.ingredients = np.empty(capacity, dtype=object)
+        self.quantities = np.empty(capacity, dtype=object)
+        self.nutrients = np.zeros((capacity, len(NUTRIENTS)), dtype=np.float64)
+
+    def __len__(self):
+        return self.size
+
+    def _grow(self):
+        capacity = max(1, len(self.dates)) * 2
+        for attr in ("dates", "meal_types", "ingredients", "quantities"):
+            old = getattr(self, attr)
+            new = np.empty(capacity, dtype=object)
+            new[:self.size] = old[:self.size]
+            setattr(self, attr, new)
+        nutrients = np.zeros((capacity, len(NUTRIENTS)), dtype=np.float64)
+        nutrients[:self.size] = self.nutrients[:self.size]
+        self.nutrients = nutrients
+
+    def append(self, date, meal_type, ingredient, quantity, nutrients):
+        if self.size == len(self.dates):
+            self._grow()
+        i = self.size
+        self.dates[i] = date
+        self.meal_types[i] = meal_type
+        self.ingredients[i] = ingredient
+        self.quantities[i] = quantity
+        self.nutrients[i] = nutrients
+        self.size += 1
+
+    def clear(self):
+        self.size = 0
+
+    def totals(self):
+        """Summed nutrients of every entry, as one reduction over the nutrient columns."""
+        return self.nutrients[:self.size].sum(axis=0)
+
+    def to_frame(self):
+        n = self.size
+        data = {
+            "Date": self.dates[:n],
+            "Meal Type": self.meal_types[:n],
+            "Ingredient": self.ingredients[:n],
+            "Quantity": self.quantities[:n],
+        }
+        for col, values in zip(self.COLUMNS[4:], self.nutrients[:n].T):
+            data[col] = values
+        return pd.DataFrame(data, columns=self.COLUMNS)
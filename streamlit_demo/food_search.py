@@ -0,0 +1,77 @@
+# food_search.py
+import bisect
+from collections import defaultdict
+
+import numpy as np
+
+
+def _trigrams(text):
+    padded = f" {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class IngredientIndex:
+    """
+    Search-as-you-type index over ingredient names.
+
+    Built once per process: a sorted key list answers prefix queries with a
+    binary search, and a trigram inverted index answers substring and typo
+    tolerant queries by counting shared trigrams with np.bincount.
+    """
+
+    def __init__(self, names):
+        self.names = np.asarray(names, dtype=object)
+        self.keys = [name.lower() for name in self.names]
+        self._lengths = np.fromiter((len(k) for k in self.keys), dtype=np.int32, count=len(self.keys))
+
+        order = sorted(range(len(self.keys)), key=self.keys.__getitem__)
+        self._sorted_keys = [self.keys[i] for i in order]
+        self._sorted_rows = np.asarray(order, dtype=np.int64)
+
+        postings = defaultdict(list)
+        for row, key in enumerate(self.keys):
+            for gram in _trigrams(key):
+                postings[gram].append(row)
+        self._postings = {g: np.asarray(rows, dtype=np.int32) for g, rows in postings.items()}
+
+    def __len__(self):
+        return len(self.names)
+
+    def _prefix_rows(self, query, limit):
+        start = bisect.bisect_left(self._sorted_keys, query)
+        end = bisect.bisect_left(self._sorted_keys, query + "\uffff", lo=start)
+        rows = self._sorted_rows[start:end]
+        if len(rows) > limit:
+            # Shortest names first: "egg" before "eggplant parmesan"
+            rows = rows[np.argsort(self._lengths[rows], kind="stable")[:limit]]
+        return rows
+
+    def search(self, query, limit=20):
+        """Returns up to `limit` names ranked by prefix match, then trigram overlap."""
+        query = " ".join(query.lower().split())
+        if not query:
+            return list(self.names[:limit])
+
+        prefix = self._prefix_rows(query, limit)
+        if len(prefix) >= limit or len(query) < 3:
+            return list(self.names[prefix])
+
+        grams = _trigrams(query)
+        lists = [self._postings[g] for g in grams if g in self._postings]
+        if not lists:
+            return list(self.names[prefix])
+
+        hits = np.bincount(np.concatenate(lists), minlength=len(self.keys))
+        hits[prefix] = 0
+        candidates = np.flatnonzero(hits >= max(1, len(grams) // 2))
+        if len(candidates) == 0:
+            return list(self.names[prefix])
+
+        # Rank by shared trigrams, penalising long names that match by accident
+        score = hits[candidates] / (len(grams) + self._lengths[candidates] / 8.0)
+        wanted = limit - len(prefix)
+        if len(candidates) > wanted:
+            top = np.argpartition(-score, wanted - 1)[:wanted]
+            candidates, score = candidates[top], score[top]
+        ranked = candidates[np.argsort(-score, kind="stable")]
+        return list(self.names[prefix]) + list(self.names[ranked])
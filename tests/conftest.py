@@ -0,0 +1,63 @@
+import asyncio
+import functools
+import http.server
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+# The scripts under test live in the repository root, the calorie tracker's
+# modules in streamlit_demo/
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+sys.path.insert(0, str(ROOT / "streamlit_demo"))
+
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
+
+
+@pytest.fixture
+def fixtures_dir():
+    """Path of tests/fixtures."""
+    return FIXTURES
+
+
+class _RecordingHandler(http.server.SimpleHTTPRequestHandler):
+    # Record each request once (errors are logged a second time) and stay quiet
+    def log_request(self, code="-", size="-"):
+        self.server.requested.append(self.path)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def fixture_server():
+    """Serves tests/fixtures over HTTP; yields (base_url, list of requested paths)."""
+    handler = functools.partial(_RecordingHandler, directory=str(FIXTURES))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    server.requested = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_port}", server.requested
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@pytest.fixture(scope="session")
+def require_chromium():
+    """Skips the test when Playwright's Chromium cannot be launched."""
+    pytest.importorskip("playwright")
+    from playwright.async_api import async_playwright
+
+    async def launch():
+        async with async_playwright() as p:
+            browser = await p.chromium.launch()
+            await browser.close()
+
+    try:
+        asyncio.run(launch())
+    except Exception as e:
+        pytest.skip(f"Chromium not available: {e}")
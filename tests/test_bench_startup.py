@@ -0,0 +1,16 @@
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("dotenv")
+pytest.importorskip("rich")
+import bench_startup
+
+
+def test_demo_starts_within_budget(monkeypatch):
+    # `python -c "import demo"` resolves demo from the working directory
+    monkeypatch.chdir(Path(bench_startup.__file__).resolve().parent)
+    times = bench_startup.measure("demo")
+
+    assert times.get("demo", 0) <= bench_startup.DEFAULT_BUDGET_MS
+    assert [m for m in bench_startup.HEAVY_MODULES if m in times] == []
@@ -0,0 +1,49 @@
+import os
+import shutil
+
+import pytest
+
+pytest.importorskip("selenium")
+import demo_selenium
+
+
+@pytest.fixture
+def require_chrome(monkeypatch):
+    """Skips unless a local chromedriver and Chrome can start (no driver downloads in tests)."""
+    path = os.getenv("CHROMEDRIVER_PATH") or shutil.which("chromedriver")
+    if not path:
+        pytest.skip("chromedriver not available")
+    monkeypatch.setenv("CHROMEDRIVER_PATH", path)
+    try:
+        demo_selenium.make_driver(headless=True).quit()
+    except Exception as e:
+        pytest.skip(f"Chrome not available: {e}")
+
+
+def test_parallel_sessions_against_mock_hrm(fixture_server, require_chrome):
+    base_url, requested = fixture_server
+    results = demo_selenium.run_parallel(sessions=2, workers=2, base_url=f"{base_url}/hrm/")
+
+    assert [r["error"] for r in results] == [None, None]
+    assert [list(r["timings"]) for r in results] == [demo_selenium.STEP_NAMES] * 2
+    assert results[0]["waits"] is not results[1]["waits"]
+    assert all(r["waits"].samples["admin search results"] for r in results)
+    assert requested.count("/hrm/") == 2
+
+    report = demo_selenium.timing_report(results)
+    for name in demo_selenium.STEP_NAMES:
+        assert f"{name:<14} {2:>5}" in report
+    assert report.endswith("2/2 sessions completed")
+
+
+def test_timing_report_skips_failed_steps():
+    results = [
+        {"session": 1, "timings": {"open site": 1.0, "login": 2.0}, "error": None},
+        {"session": 2, "timings": {"open site": 3.0}, "error": "TimeoutException: login"},
+    ]
+    lines = demo_selenium.timing_report(results).splitlines()
+
+    assert lines[1].split() == ["open", "site", "2", "2.00", "3.00", "3.00"]
+    assert lines[2].split() == ["login", "1", "2.00", "2.00", "2.00"]
+    assert not any(line.startswith("logout") for line in lines)
+    assert lines[-1] == "1/2 sessions completed"
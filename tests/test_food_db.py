@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from food_db import FoodDB, MealLog
+
+CATALOG = {
+    "Test Egg": {"cal": 78, "protein": 6, "carbs": 0.6, "fat": 5, "per": (1, "piece"), "piece_weight": 50},
+    "Test Milk": {"cal": 103, "protein": 8, "carbs": 12, "fat": 2.4, "per": (1, "cup"), "density": 1.03},
+    "Test Oats": {"cal": 150, "protein": 5, "carbs": 27, "fat": 3, "per": (40, "g")},
+}
+
+
+@pytest.fixture
+def db():
+    return FoodDB.from_dict(CATALOG)
+
+
+def test_rows_and_scale(db):
+    rows = db.rows(["Test Oats", "Test Egg"])
+    assert list(rows) == [2, 0]
+    assert db.scale(rows, [2, 0.5]).tolist() == [[300, 10, 54, 6], [39, 3, 0.3, 2.5]]
+
+
+def test_servings_convert_onto_the_serving_unit(db):
+    rows = db.rows(["Test Egg", "Test Egg", "Test Milk", "Test Oats"])
+    servings = db.servings(rows, [2, 100, 236.5882365, 1], ["piece", "g", "ml", "kg"])
+    np.testing.assert_allclose(servings, [2, 2, 1, 25])
+
+
+def _log(n, capacity):
+    log = MealLog(capacity=capacity)
+    for i in range(n):
+        log.append(f"2026-10-{i + 1:02d}", "Lunch", f"food {i}", f"{i} g", [i, 1, 2, 3])
+    return log
+
+
+def test_meal_log_grows_past_capacity():
+    log = _log(5, capacity=2)
+    assert len(log) == 5
+    assert len(log.dates) >= 5
+    assert list(log.ingredients[:5]) == [f"food {i}" for i in range(5)]
+    assert log.nutrients[:5, 0].tolist() == [0, 1, 2, 3, 4]
+
+
+def test_meal_log_grows_from_zero_capacity():
+    assert len(_log(3, capacity=0)) == 3
+
+
+def test_meal_log_totals_and_clear():
+    log = _log(4, capacity=8)
+    assert log.totals().tolist() == [6, 4, 8, 12]
+    log.clear()
+    assert len(log) == 0
+    assert log.totals().tolist() == [0, 0, 0, 0]
+    assert log.to_frame().empty
+
+
+def test_meal_log_frame():
+    df = _log(2, capacity=1).to_frame()
+    assert list(df.columns) == MealLog.COLUMNS
+    assert df["Ingredient"].tolist() == ["food 0", "food 1"]
+    assert df["Calories"].tolist() == [0, 1]
+    assert df["Fats (g)"].tolist() == [3, 3]
@@ -0,0 +1,46 @@
+import pytest
+
+from food_search import IngredientIndex
+
+NAMES = [
+    "Eggplant Parmesan", "Egg", "Egg White", "Chicken Breast", "Chicken Thigh",
+    "Brown Rice", "White Rice", "Peanut Butter", "Almond Butter", "Broccoli",
+]
+
+
+@pytest.fixture
+def index():
+    return IngredientIndex(NAMES)
+
+
+def test_prefix_matches_come_first(index):
+    assert index.search("egg") == ["Egg", "Egg White", "Eggplant Parmesan"]
+    assert index.search("  CHICKEN ") == ["Chicken Breast", "Chicken Thigh"]
+
+
+def test_prefix_over_limit_keeps_shortest_names(index):
+    assert index.search("egg", limit=2) == ["Egg", "Egg White"]
+
+
+def test_substring_follows_prefix(index):
+    assert set(index.search("butter")[:2]) == {"Peanut Butter", "Almond Butter"}
+
+
+def test_typos_are_recalled(index):
+    assert index.search("chiken brest")[0] == "Chicken Breast"
+    assert index.search("brocoli")[0] == "Broccoli"
+
+
+def test_limit_caps_results(index):
+    assert len(index.search("rice", limit=1)) == 1
+    assert len(index.search("e", limit=3)) <= 3
+    assert len(index.search("chicken rice butter", limit=4)) <= 4
+
+
+def test_empty_query_lists_first_names(index):
+    assert index.search("") == NAMES
+    assert index.search("   ", limit=2) == NAMES[:2]
+
+
+def test_no_match(index):
+    assert index.search("zzzz") == []
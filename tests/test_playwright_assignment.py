@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+from playwright.async_api import async_playwright
+
+import playwright_assignment as pa
+
+pytestmark = pytest.mark.usefixtures("require_chromium")
+
+
+async def _scrape_fixture(url, max_pages, stop_at=None):
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        context = await browser.new_context()
+        await context.route("**/*", pa.block_heavy_resources)
+        page = await context.new_page()
+        posts = await pa.scrape_listing(page, url, max_pages=max_pages, stop_at=stop_at)
+        await browser.close()
+        return posts
+
+
+def test_scrape_listing_follows_next_links(fixture_server):
+    base_url, _ = fixture_server
+    posts = asyncio.run(_scrape_fixture(f"{base_url}/old_reddit/page1.html", max_pages=5))
+
+    assert [p["id"] for p in posts] == ["t3_p1a", "t3_p1b", "t3_p1c", "t3_p2a"]
+    assert posts[0]["title"] == "How FAST would you pull your kid out of my daycare?"
+    assert posts[3]["title"] == "Am I a bad mom for not wanting custody?"
+
+
+def test_scrape_listing_respects_max_pages(fixture_server):
+    base_url, _ = fixture_server
+    posts = asyncio.run(_scrape_fixture(f"{base_url}/old_reddit/page1.html", max_pages=1))
+
+    assert [p["id"] for p in posts] == ["t3_p1a", "t3_p1b", "t3_p1c"]
+
+
+def test_scrape_listing_stops_at_last_seen_post(fixture_server):
+    base_url, requested = fixture_server
+    posts = asyncio.run(_scrape_fixture(f"{base_url}/old_reddit/page1.html", max_pages=5, stop_at="t3_p1c"))
+
+    assert [p["id"] for p in posts] == ["t3_p1a", "t3_p1b"]
+    assert "/old_reddit/page2.html" not in requested
+
+
+def test_posts_carry_their_permalink(fixture_server):
+    base_url, _ = fixture_server
+    posts = asyncio.run(_scrape_fixture(f"{base_url}/old_reddit/page1.html", max_pages=1))
+
+    assert posts[0]["permalink"] == f"{base_url}/r/workingmoms/comments/p1a/daycare/"
+    assert posts[0]["url"] == posts[2]["url"] == "https://example.com/daycare"
+
+
+def test_heavy_resources_are_blocked(fixture_server):
+    base_url, requested = fixture_server
+    asyncio.run(_scrape_fixture(f"{base_url}/old_reddit/page1.html", max_pages=5))
+
+    assert "/old_reddit/page2.html" in requested
+    assert not [path for path in requested if path.endswith((".css", ".png"))]
+
+
+def test_scrape_listings_uses_a_page_pool(fixture_server, tmp_path):
+    base_url, _ = fixture_server
+    urls = [f"{base_url}/old_reddit/page1.html", f"{base_url}/old_reddit/page2.html"]
+    results = asyncio.run(pa.scrape_listings(urls, pool_size=2, headless=True,
+                                             user_data_dir=str(tmp_path / "profile")))
+
+    assert [p["id"] for p in results[urls[0]]] == ["t3_p1a", "t3_p1b", "t3_p1c", "t3_p2a"]
+    assert [p["id"] for p in results[urls[1]]] == ["t3_p2a"]
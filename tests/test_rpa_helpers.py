@@ -0,0 +1,73 @@
+import pytest
+
+pytest.importorskip("pyscreeze")
+from PIL import Image
+
+from rpa_helpers import ScreenLocator
+
+
+class StaticScreen:
+    """Stands in for pyautogui.screenshot with a fixture image that can be swapped."""
+
+    def __init__(self, folder, name="screen.png"):
+        self.folder = folder
+        self.show(name)
+
+    def show(self, name):
+        self.image = Image.open(self.folder / name)
+
+    def __call__(self):
+        return self.image
+
+
+@pytest.fixture
+def shot(fixtures_dir):
+    return StaticScreen(fixtures_dir / "rpa")
+
+
+@pytest.fixture
+def button(fixtures_dir):
+    return str(fixtures_dir / "rpa" / "send_button.png")
+
+
+def test_locate_finds_template(shot, button):
+    screen = ScreenLocator(screenshot=shot)
+    box = screen.locate(button)
+    assert (box.left, box.top, box.width, box.height) == (240, 150, 40, 20)
+
+
+def test_second_locate_uses_cache(shot, button):
+    screen = ScreenLocator(screenshot=shot)
+    first = screen.locate(button)
+    assert screen.locate(button) == first
+    assert (screen.hits, screen.misses) == (1, 1)
+
+
+def test_moved_target_falls_back_to_full_search(shot, button):
+    screen = ScreenLocator(screenshot=shot)
+    screen.locate(button)
+    shot.show("screen_moved.png")
+    box = screen.locate(button)
+    assert (box.left, box.top) == (60, 110)
+    assert (screen.hits, screen.misses) == (0, 2)
+
+
+def test_locate_within_region(shot, button):
+    screen = ScreenLocator(screenshot=shot)
+    assert screen.locate(button, region=(0, 0, 160, 100)) is None
+    assert screen.locate(button, region=(200, 120, 120, 80)).left == 240
+
+
+def test_wait_for_times_out(shot, button):
+    shot.show("screen_moved.png")
+    screen = ScreenLocator(poll_interval=0.01, screenshot=shot)
+    with pytest.raises(TimeoutError):
+        screen.wait_for(button, region=(200, 120, 120, 80), timeout=0.05)
+
+
+def test_missing_template_falls_back_to_sleep(shot, tmp_path):
+    screen = ScreenLocator(screenshot=shot)
+    missing = str(tmp_path / "not_captured.png")
+    assert screen.wait_for(missing, fallback_sleep=0) is None
+    with pytest.raises(FileNotFoundError):
+        screen.wait_for(missing)
@@ -0,0 +1,51 @@
+import scrape_store
+
+import pytest
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "scrape.db")
+    scrape_store.create_tables(path)
+    return path
+
+
+def _post(id, title, url=None, permalink=None):
+    return {"id": id, "title": title, "url": url, "permalink": permalink}
+
+
+def test_posts_sharing_a_link_are_kept(db):
+    posts = [
+        _post("t3_a", "First?", "https://example.com/x", "/r/s/comments/a/"),
+        _post("t3_b", "Second?", "https://example.com/x", "/r/s/comments/b/"),
+    ]
+    assert scrape_store.save_posts("top", posts, db_name=db) == 2
+
+
+def test_missing_permalinks_do_not_collide(db):
+    posts = [_post("t3_a", "First?", ""), _post("t3_b", "Second?", "")]
+    assert scrape_store.save_posts("top", posts, db_name=db) == 2
+
+
+def test_duplicates_are_ignored(db):
+    posts = [_post("t3_a", "First?", permalink="/r/s/comments/a/")]
+    scrape_store.save_posts("top", posts, db_name=db)
+
+    assert scrape_store.save_posts("top", posts, db_name=db) == 0
+    assert scrape_store.save_posts("top", [_post("t3_z", "Again?", permalink="/r/s/comments/a/")], db_name=db) == 0
+
+
+def test_newest_marker_is_kept_when_nothing_is_new(db):
+    scrape_store.save_posts("new", [_post("t3_b", "B?"), _post("t3_a", "A?")], newest="t3_b", db_name=db)
+    scrape_store.save_posts("new", [], db_name=db)
+
+    assert scrape_store.newest_id("new", db) == "t3_b"
+    assert scrape_store.newest_id("top", db) is None
+
+
+def test_export_streams_only_questions(db, tmp_path):
+    scrape_store.save_posts("top", [_post("t3_a", "Why?"), _post("t3_b", "Statement")], db_name=db)
+    out = tmp_path / "questions.txt"
+
+    assert scrape_store.export_questions(str(out), db) == 1
+    assert out.read_text(encoding="utf-8") == "Why?"
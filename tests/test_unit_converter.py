@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+import unit_converter
+from unit_converter import (ConversionError, conversion_factor, convert, convert_many,
+                            normalize_unit, parse_quantity, register_food)
+
+
+@pytest.fixture(autouse=True)
+def foods(monkeypatch):
+    """Gives each test its own food registry and empty caches."""
+    monkeypatch.setattr(unit_converter, "FOOD_PROPERTIES", {"water": {"density": 1.0}})
+    register_food("flour", density=0.5)
+    register_food("egg", piece_weight=50)
+    yield
+    unit_converter._dimension_factor.cache_clear()
+    conversion_factor.cache_clear()
+
+
+@pytest.mark.parametrize("qty, src, dst, expected", [
+    (1, "kg", "g", 1000),
+    (1, "lb", "oz", 16),
+    (3, "tsp", "tbsp", 1),
+    (1, "cup", "fl_oz", 8),
+    (1500, "ml", "l", 1.5),
+    (2, "piece", "piece", 2),
+])
+def test_same_dimension(qty, src, dst, expected):
+    assert convert(qty, src, dst) == pytest.approx(expected)
+
+
+def test_aliases():
+    assert normalize_unit(" Fluid  Ounces ") == "fl_oz"
+    assert normalize_unit("LBS") == "lb"
+    assert convert(2, "tablespoons", "teaspoon") == pytest.approx(6)
+
+
+def test_density_bridge():
+    assert convert(1, "cup", "g", food="Flour") == pytest.approx(236.5882365 * 0.5)
+    assert convert(100, "g", "ml", food="flour") == pytest.approx(200)
+    assert convert(500, "ml", "g", food="water") == pytest.approx(500)
+
+
+def test_piece_bridge():
+    assert convert(3, "piece", "g", food="egg") == pytest.approx(150)
+    assert convert(1, "lb", "piece", food="egg") == pytest.approx(453.59237 / 50)
+
+
+def test_bridge_through_two_edges():
+    register_food("honey", density=1.4, piece_weight=21)
+    # piece -> g -> ml
+    assert convert(2, "piece", "ml", food="honey") == pytest.approx(2 * 21 / 1.4)
+
+
+def test_unknown_unit():
+    with pytest.raises(ConversionError, match="Unknown unit"):
+        convert(1, "handful", "g")
+
+
+@pytest.mark.parametrize("src, dst, food", [
+    ("cup", "g", None),
+    ("cup", "g", "egg"),
+    ("piece", "g", "flour"),
+    ("piece", "ml", "unknown food"),
+])
+def test_missing_bridge(src, dst, food):
+    with pytest.raises(ConversionError, match="Cannot convert"):
+        convert(1, src, dst, food=food)
+
+
+def test_conversion_error_is_a_value_error():
+    assert issubclass(ConversionError, ValueError)
+
+
+def test_register_food_clears_cache():
+    assert convert(1, "ml", "g", food="flour") == pytest.approx(0.5)
+    register_food("flour", density=0.6)
+    assert convert(1, "ml", "g", food="flour") == pytest.approx(0.6)
+
+    with pytest.raises(ConversionError):
+        convert(1, "piece", "g", food="flour")
+    register_food("flour", piece_weight=10)
+    assert convert(1, "piece", "g", food="flour") == pytest.approx(10)
+
+
+def test_convert_many():
+    result = convert_many([1, 2, 100, 1], ["cup", "piece", "g", "kg"], ["g", "g", "ml", "g"],
+                          ["flour", "egg", "flour", None])
+    np.testing.assert_allclose(result, [236.5882365 * 0.5, 100, 200, 1000])
+
+
+def test_convert_many_broadcasts_single_values():
+    np.testing.assert_allclose(convert_many([1, 2, 3], "kg", "g"), [1000, 2000, 3000])
+    np.testing.assert_allclose(convert_many([2, 4], "piece", "g", "egg"), [100, 200])
+    assert convert_many([], "kg", "g").shape == (0,)
+
+
+def test_convert_many_raises_for_any_bad_pair():
+    with pytest.raises(ConversionError):
+        convert_many([1, 1], ["g", "cup"], "g")
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("500", (500, "ml")),
+    (" 500 ml ", (500, "ml")),
+    ("16 fl oz", (16, "fl_oz")),
+    ("1.5 Liters", (1.5, "l")),
+])
+def test_parse_quantity(text, expected):
+    assert parse_quantity(text, "ml") == expected
+
+
+@pytest.mark.parametrize("text, error", [
+    ("", ValueError),
+    ("abc ml", ValueError),
+    ("5 buckets", ConversionError),
+])
+def test_parse_quantity_rejects(text, error):
+    with pytest.raises(error):
+        parse_quantity(text, "ml")
@@ -0,0 +1,52 @@
+import os
+
+import pytest
+
+import user_store
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(user_store, "DATA_DIR", str(tmp_path / "user_data"))
+    return tmp_path / "user_data"
+
+
+def _write(user_id, value):
+    conn = user_store.connect("tracker.db", user_id)
+    conn.execute("CREATE TABLE IF NOT EXISTS log (value TEXT)")
+    conn.execute("INSERT INTO log VALUES (?)", (value,))
+    conn.commit()
+    conn.close()
+
+
+def _read(user_id):
+    conn = user_store.connect("tracker.db", user_id)
+    rows = [r[0] for r in conn.execute("SELECT value FROM log")]
+    conn.close()
+    return rows
+
+
+def test_users_get_separate_shards():
+    _write("alice", "a1")
+    _write("bob", "b1")
+    _write("alice", "a2")
+    assert _read("alice") == ["a1", "a2"]
+    assert _read("bob") == ["b1"]
+
+
+def test_shard_path(data_dir):
+    path = user_store.db_path("some/dir/tracker.db", "Alice Smith")
+    assert os.path.dirname(path) == str(data_dir / user_store.user_key("Alice Smith"))
+    assert os.path.basename(path) == "tracker.db"
+
+
+def test_similar_ids_do_not_collide():
+    keys = {user_store.user_key(u) for u in ["Ann", "ann", "a/nn", "a nn", "../ann"]}
+    assert len(keys) == 5
+    assert all("/" not in k and ".." not in k for k in keys)
+
+
+@pytest.mark.parametrize("user_id", [None, "", "   "])
+def test_no_user_uses_shared_file(user_id, data_dir):
+    assert user_store.db_path("tracker.db", user_id) == "tracker.db"
+    assert not data_dir.exists()
@@ -0,0 +1,124 @@
+import asyncio
+
+import pytest
+
+from wait_helpers import WaitStats, element_count_changed, pw_wait_for_count_change, pw_wait_for_selector, wait_until
+
+
+def test_default_until_first_sample():
+    stats = WaitStats(default_timeout=10)
+    assert stats.timeout("table") == 10
+
+
+def test_fast_runs_do_not_drop_below_floor():
+    stats = WaitStats(min_timeout=10)
+    for _ in range(5):
+        stats.record("table", 0.3)
+    assert stats.timeout("table") == 10
+
+
+def test_slow_runs_raise_the_budget():
+    stats = WaitStats(min_timeout=10, headroom=3, max_timeout=60)
+    for _ in range(5):
+        stats.record("table", 6.0)
+    assert stats.timeout("table") == pytest.approx(18.0)
+
+
+def test_failed_wait_doubles_budget_until_success():
+    stats = WaitStats(min_timeout=10, max_timeout=60)
+    stats.record("table", 0.3)
+
+    with pytest.raises(TimeoutError):
+        with stats.timed("table"):
+            raise TimeoutError
+    assert stats.failures["table"] == 1
+    assert stats.timeout("table") == 20
+
+    stats.record("table", 0.3)
+    assert stats.timeout("table") == 10
+
+
+def test_budget_is_capped():
+    stats = WaitStats(max_timeout=30)
+    for _ in range(4):
+        stats.record("table", 1.0, ok=False)
+    assert stats.timeout("table") == 30
+
+
+class FakeDriver:
+    """Answers find_elements with a row count that grows after a few polls."""
+
+    def __init__(self, counts):
+        self.counts = list(counts)
+
+    def find_elements(self, by, value):
+        count = self.counts.pop(0) if len(self.counts) > 1 else self.counts[0]
+        return [object()] * count
+
+
+def test_element_count_changed():
+    condition = element_count_changed(("css selector", "tr"), 2)
+    assert not condition(FakeDriver([2]))
+    assert condition(FakeDriver([3]))
+    assert condition(FakeDriver([0]))
+
+
+def test_wait_until_records_success():
+    pytest.importorskip("selenium")
+    stats = WaitStats()
+    wait_until(FakeDriver([2, 2, 3]), element_count_changed(("css selector", "tr"), 2), "rows", stats, poll=0.01)
+    assert len(stats.samples["rows"]) == 1
+    assert stats.failures["rows"] == 0
+
+
+def test_wait_until_records_timeout():
+    pytest.importorskip("selenium")
+    from selenium.common.exceptions import TimeoutException
+
+    stats = WaitStats(default_timeout=0.05, min_timeout=0.05)
+    with pytest.raises(TimeoutException, match="rows"):
+        wait_until(FakeDriver([2]), element_count_changed(("css selector", "tr"), 2), "rows", stats, poll=0.01)
+    assert stats.failures["rows"] == 1
+    assert stats.timeout("rows") >= 0.1
+
+
+async def _on_list_page(url, check):
+    from playwright.async_api import async_playwright
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch()
+        page = await browser.new_page()
+        await page.goto(url)
+        try:
+            return await check(page)
+        finally:
+            await browser.close()
+
+
+def test_pw_wait_for_selector(fixture_server, require_chromium):
+    base_url, _ = fixture_server
+    stats = WaitStats()
+
+    async def check(page):
+        element = await pw_wait_for_selector(page, "#status", "status", stats=stats)
+        return await element.inner_text()
+
+    assert asyncio.run(_on_list_page(f"{base_url}/wait_helpers/list.html", check)) == "loaded"
+    assert len(stats.samples["status"]) == 1
+
+
+def test_pw_wait_for_count_change(fixture_server, require_chromium):
+    base_url, _ = fixture_server
+    quick, stats = WaitStats(default_timeout=0.05, min_timeout=0.05), WaitStats()
+
+    async def check(page):
+        # Nothing is added without a click, so this wait times out
+        with pytest.raises(Exception):
+            await pw_wait_for_count_change(page, "#items li", 2, "items", stats=quick)
+        await page.click("#add")
+        await pw_wait_for_count_change(page, "#items li", 2, "items", stats=stats)
+        return await page.locator("#items li").count()
+
+    assert asyncio.run(_on_list_page(f"{base_url}/wait_helpers/list.html", check)) == 3
+    assert quick.failures["items"] == 1
+    assert stats.failures["items"] == 0
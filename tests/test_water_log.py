@@ -0,0 +1,58 @@
+import sqlite3
+from datetime import datetime
+
+import pytest
+
+pytest.importorskip("matplotlib")
+import water_log
+
+
+@pytest.fixture
+def db(tmp_path, monkeypatch):
+    path = str(tmp_path / "water.db")
+    monkeypatch.setattr(water_log, "DB_NAME", path)
+    return path
+
+
+def test_duplicate_days_are_folded(db):
+    # Baseline schema: no unique date, so a day could end up with several rows
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE water (id INTEGER PRIMARY KEY AUTOINCREMENT, date TEXT, amount INTEGER)")
+    conn.executemany("INSERT INTO water (date, amount) VALUES (?, ?)", [
+        ("2026-10-01", 500), ("2026-10-01", 250), ("2026-10-02", 1000), ("2026-10-01", 100),
+    ])
+    conn.commit()
+    conn.close()
+
+    water_log.create_table()
+    water_log.create_table()  # running it again leaves the data alone
+
+    conn = sqlite3.connect(db)
+    rows = conn.execute("SELECT date, amount FROM water ORDER BY date").fetchall()
+    conn.close()
+    assert rows == [("2026-10-01", 850), ("2026-10-02", 1000)]
+
+
+def test_log_water_returns_running_total(db):
+    water_log.create_table()
+    assert water_log.log_water(250) == 250
+    assert water_log.log_water(500) == 750
+    assert water_log.get_today_progress() == 750
+
+    conn = sqlite3.connect(db)
+    assert conn.execute("SELECT COUNT(*) FROM water").fetchone()[0] == 1
+    conn.close()
+
+
+def test_hourly_breakdown(db):
+    water_log.create_table()
+    today = datetime.now().strftime("%Y-%m-%d")
+    conn = sqlite3.connect(db)
+    conn.executemany("INSERT INTO water_events (ts, amount) VALUES (?, ?)", [
+        (f"{today} 08:05:00", 200), (f"{today} 08:45:00", 300),
+        (f"{today} 13:10:00", 400), ("2000-01-01 08:00:00", 999),
+    ])
+    conn.commit()
+    conn.close()
+    assert water_log.get_hourly_breakdown() == [(8, 500), (13, 400)]
+    assert water_log.get_hourly_breakdown("2000-01-01") == [(8, 999)]
@@ -0,0 +1,97 @@
+import asyncio
+import sqlite3
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+pytest.importorskip("playwright")
+import whatsapp_queue
+from wait_helpers import WaitStats
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "queue.db")
+    whatsapp_queue.create_table(path)
+    return path
+
+
+def _send_ats(db):
+    conn = sqlite3.connect(db)
+    rows = [r[0] for r in conn.execute("SELECT send_at FROM jobs ORDER BY id")]
+    conn.close()
+    return rows
+
+
+@pytest.mark.parametrize("value", [
+    "2026-10-20 09:00:00",
+    "2026-10-20 09:00",
+    "2026-10-20T09:00",
+    "2026-10-20T09:00:00",
+    " 2026-10-20 09:00 ",
+])
+def test_send_at_is_normalized(value):
+    assert whatsapp_queue.parse_send_at(value) == "2026-10-20 09:00:00"
+
+
+@pytest.mark.parametrize("value", ["tomorrow", "20/10/2026 09:00", "2026-13-01 09:00"])
+def test_bad_send_at_is_rejected(value):
+    with pytest.raises(ValueError):
+        whatsapp_queue.parse_send_at(value)
+
+
+def test_enqueue_normalizes_send_at(db):
+    whatsapp_queue.enqueue("Alice", "hi", "2026-10-20T09:00", db_name=db)
+    whatsapp_queue.enqueue("Bob", "hi", "2026-10-20 08:30", db_name=db)
+    assert _send_ats(db) == ["2026-10-20 09:00:00", "2026-10-20 08:30:00"]
+    with pytest.raises(ValueError):
+        whatsapp_queue.enqueue("Carol", "hi", "soon", db_name=db)
+
+
+def test_csv_rows_are_normalized(db, tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text("chat,message,send_at\nAlice,hi,2026-10-20 09:00\nBob,hey,\n", encoding="utf-8")
+    assert whatsapp_queue.load_jobs_from_csv(str(path), db) == 2
+    first, second = _send_ats(db)
+    assert first == "2026-10-20 09:00:00"
+    assert whatsapp_queue.parse_send_at(second) == second
+
+
+def test_bad_csv_row_names_the_line_and_queues_nothing(db, tmp_path):
+    path = tmp_path / "jobs.csv"
+    path.write_text("chat,message,send_at\nAlice,hi,2026-10-20 09:00\nBob,hey,next week\n", encoding="utf-8")
+    with pytest.raises(ValueError, match="line 3"):
+        whatsapp_queue.load_jobs_from_csv(str(path), db)
+    assert _send_ats(db) == []
+
+
+def test_zero_rate_is_rejected(db):
+    with pytest.raises(ValueError):
+        asyncio.run(whatsapp_queue.drain_queue(db, per_minute=0))
+
+
+def test_drain_queue_against_stub(db, fixture_server, tmp_path, require_chromium):
+    base_url, requested = fixture_server
+    for chat in ["Alice", "Nobody", "Bob"]:
+        whatsapp_queue.enqueue(chat, f"hi {chat}", db_name=db)
+
+    stats = WaitStats(default_timeout=1, min_timeout=1, max_timeout=2)
+    result = asyncio.run(whatsapp_queue.drain_queue(
+        db, f"{base_url}/whatsapp/index.html", per_minute=120, max_attempts=2, headless=True,
+        user_data_dir=str(tmp_path / "profile"), retry_delay=0.1, stats=stats,
+    ))
+    assert result == (2, 1)
+
+    conn = sqlite3.connect(db)
+    jobs = {chat: rest for chat, *rest in conn.execute("SELECT chat, status, attempts, last_error FROM jobs")}
+    conn.close()
+    assert jobs["Alice"][:2] == ["sent", 0]
+    assert jobs["Bob"][:2] == ["sent", 0]
+    assert jobs["Nobody"][:2] == ["failed", 2]
+    assert jobs["Nobody"][2].startswith("TimeoutError")
+    assert stats.failures["whatsapp chat open"] == 2
+
+    # The stub reports each delivered message; 120 per minute means >= 0.5 s apart
+    sends = [parse_qs(urlsplit(path).query) for path in requested if path.startswith("/whatsapp/sent")]
+    assert [q["chat"][0] for q in sends] == ["Alice", "Bob"]
+    assert int(sends[1]["t"][0]) - int(sends[0]["t"][0]) >= 500
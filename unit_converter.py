@@ -0,0 +1,158 @@
+# unit_converter.py
+from collections import deque
+from functools import lru_cache
+
+import numpy as np
+
+# -------------------------- Unit Tables --------------------------
+# Every unit belongs to one dimension and is stored as a factor to that
+# dimension's base unit (grams, millilitres, pieces).
+UNITS = {
+    # mass -> g
+    "mg": ("mass", 0.001),
+    "g": ("mass", 1.0),
+    "kg": ("mass", 1000.0),
+    "oz": ("mass", 28.349523125),
+    "lb": ("mass", 453.59237),
+    # volume -> ml
+    "ml": ("volume", 1.0),
+    "l": ("volume", 1000.0),
+    "tsp": ("volume", 4.92892159375),
+    "tbsp": ("volume", 14.78676478125),
+    "fl_oz": ("volume", 29.5735295625),
+    "cup": ("volume", 236.5882365),
+    # count -> piece
+    "piece": ("count", 1.0),
+}
+
+ALIASES = {
+    "gram": "g", "grams": "g",
+    "kilogram": "kg", "kilograms": "kg", "kgs": "kg",
+    "ounce": "oz", "ounces": "oz",
+    "pound": "lb", "pounds": "lb", "lbs": "lb",
+    "millilitre": "ml", "milliliter": "ml", "millilitres": "ml", "milliliters": "ml",
+    "litre": "l", "liter": "l", "litres": "l", "liters": "l",
+    "teaspoon": "tsp", "teaspoons": "tsp",
+    "tablespoon": "tbsp", "tablespoons": "tbsp",
+    "fl oz": "fl_oz", "floz": "fl_oz", "fluid ounce": "fl_oz", "fluid ounces": "fl_oz",
+    "cups": "cup",
+    "pieces": "piece", "pc": "piece", "pcs": "piece",
+}
+
+# Precomputed factor for every same-dimension pair: FACTORS[a][b] * qty_a = qty_b
+FACTORS = {
+    a: {b: fa / fb for b, (db, fb) in UNITS.items() if db == da}
+    for a, (da, fa) in UNITS.items()
+}
+
+# Per-food properties that bridge dimensions:
+#   density     -> grams per millilitre (mass <-> volume)
+#   piece_weight -> grams per piece     (count <-> mass)
+FOOD_PROPERTIES = {
+    "water": {"density": 1.0},
+}
+
+
+class ConversionError(ValueError):
+    pass
+
+
+# -------------------------- Core Functions --------------------------
+def normalize_unit(unit):
+    key = " ".join(unit.strip().lower().split())
+    key = ALIASES.get(key, key)
+    if key not in UNITS:
+        raise ConversionError(f"Unknown unit: {unit!r}")
+    return key
+
+
+def register_food(name, density=None, piece_weight=None):
+    """Adds or updates the density (g/ml) and piece weight (g) of a food."""
+    props = FOOD_PROPERTIES.setdefault(name.lower(), {})
+    if density is not None:
+        props["density"] = float(density)
+    if piece_weight is not None:
+        props["piece_weight"] = float(piece_weight)
+    _dimension_factor.cache_clear()
+    conversion_factor.cache_clear()
+
+
+def _dimension_edges(food):
+    """Edges of the dimension graph for a food: (from, to) -> base-unit factor."""
+    props = FOOD_PROPERTIES.get(food.lower(), {}) if food else {}
+    edges = {}
+    if "density" in props:
+        edges[("volume", "mass")] = props["density"]
+        edges[("mass", "volume")] = 1.0 / props["density"]
+    if "piece_weight" in props:
+        edges[("count", "mass")] = props["piece_weight"]
+        edges[("mass", "count")] = 1.0 / props["piece_weight"]
+    return edges
+
+
+@lru_cache(maxsize=None)
+def _dimension_factor(src, dst, food):
+    """Breadth-first search for a path between two dimensions for a food."""
+    if src == dst:
+        return 1.0
+    edges = _dimension_edges(food)
+    queue = deque([(src, 1.0)])
+    seen = {src}
+    while queue:
+        dim, factor = queue.popleft()
+        for (a, b), f in edges.items():
+            if a != dim or b in seen:
+                continue
+            if b == dst:
+                return factor * f
+            seen.add(b)
+            queue.append((b, factor * f))
+    what = f" for {food!r}" if food else ""
+    raise ConversionError(f"Cannot convert {src} to {dst}{what}: missing density or piece weight")
+
+
+@lru_cache(maxsize=4096)
+def conversion_factor(from_unit, to_unit, food=None):
+    """Multiplier taking a quantity in from_unit to to_unit (memoized)."""
+    src, dst = normalize_unit(from_unit), normalize_unit(to_unit)
+    if UNITS[src][0] == UNITS[dst][0]:
+        return FACTORS[src][dst]
+    bridge = _dimension_factor(UNITS[src][0], UNITS[dst][0], food.lower() if food else None)
+    return UNITS[src][1] * bridge / UNITS[dst][1]
+
+
+def convert(quantity, from_unit, to_unit, food=None):
+    return quantity * conversion_factor(from_unit, to_unit, food)
+
+
+def convert_many(quantities, from_units, to_units, foods=None):
+    """
+    Vectorized conversion of many quantities.
+
+    from_units, to_units and foods may be single values or sequences matching
+    quantities; each distinct (from, to, food) triple is resolved only once.
+    """
+    quantities = np.asarray(quantities, dtype=np.float64)
+    n = quantities.shape[0] if quantities.ndim else 1
+    if isinstance(from_units, str):
+        from_units = [from_units] * n
+    if isinstance(to_units, str):
+        to_units = [to_units] * n
+    if foods is None or isinstance(foods, str):
+        foods = [foods] * n
+
+    keys = list(zip(from_units, to_units, foods))
+    lookup = {key: i for i, key in enumerate(dict.fromkeys(keys))}
+    factors = np.array([conversion_factor(*key) for key in lookup], dtype=np.float64)
+    codes = np.fromiter((lookup[k] for k in keys), dtype=np.intp, count=n)
+    return quantities * factors[codes]
+
+
+def parse_quantity(text, default_unit):
+    """Parses '500', '500 ml' or '16 fl oz' into (amount, unit)."""
+    parts = text.strip().split(maxsplit=1)
+    if not parts:
+        raise ValueError("Empty quantity")
+    amount = float(parts[0])
+    unit = normalize_unit(parts[1]) if len(parts) > 1 else default_unit
+    return amount, unit
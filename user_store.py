@@ -0,0 +1,35 @@
+# user_store.py
+import hashlib
+import os
+import re
+import sqlite3
+
+# Root folder for per-user shard files; override to point at persistent storage
+DATA_DIR = os.getenv("TRACKER_DATA_DIR", "user_data")
+
+
+def user_key(user_id):
+    """Maps a user id to a filesystem-safe, collision-free folder name."""
+    slug = re.sub(r"[^a-z0-9_-]+", "-", user_id.strip().lower()).strip("-")[:32]
+    digest = hashlib.sha1(user_id.strip().encode("utf-8")).hexdigest()[:8]
+    return f"{slug or 'user'}-{digest}"
+
+
+def db_path(db_name, user_id=None):
+    """
+    Returns the SQLite file for a user.
+
+    Each user gets their own shard file under DATA_DIR, so a user's queries
+    only ever touch their own rows no matter how many users exist.
+    Without a user id the original single-user file is used.
+    """
+    if not user_id or not user_id.strip():
+        return db_name
+    folder = os.path.join(DATA_DIR, user_key(user_id))
+    os.makedirs(folder, exist_ok=True)
+    return os.path.join(folder, os.path.basename(db_name))
+
+
+def connect(db_name, user_id=None):
+    """Opens a connection to the user's shard of db_name."""
+    return sqlite3.connect(db_path(db_name, user_id))
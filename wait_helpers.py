@@ -0,0 +1,107 @@
+# wait_helpers.py
+"""
+Event-driven waits for the Selenium and Playwright scripts.
+
+Instead of fixed sleeps, flows wait on a concrete condition (an element
+appears or goes stale, a row count changes). Every wait is timed, and
+its timeout adapts to how long the same wait took on earlier runs.
+"""
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+
+
+class WaitStats:
+    """
+    Records how long each named wait took and derives adaptive timeouts.
+
+    A wait's budget is headroom x the 95th percentile of its recent runs,
+    never below min_timeout (the old fixed wait). Every failed wait doubles
+    the budget for the next attempt until one succeeds, so a slow app raises
+    the budget instead of failing over and over.
+    """
+
+    def __init__(self, default_timeout=10.0, min_timeout=10.0, max_timeout=60.0, headroom=3.0, window=20):
+        self.default_timeout = default_timeout
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.headroom = headroom
+        self.window = window
+        self.samples = defaultdict(list)
+        self.failures = defaultdict(int)
+        self._failure_streak = defaultdict(int)
+
+    def timeout(self, name):
+        """Seconds to allow for the next wait called name."""
+        recent = sorted(self.samples.get(name, [])[-self.window:])
+        if recent:
+            p95 = recent[min(len(recent) - 1, int(0.95 * len(recent)))]
+            budget = max(self.min_timeout, self.headroom * p95)
+        else:
+            budget = self.default_timeout
+        budget *= 2 ** self._failure_streak.get(name, 0)
+        return min(self.max_timeout, budget)
+
+    def record(self, name, seconds, ok=True):
+        self.samples[name].append(seconds)
+        if ok:
+            self._failure_streak[name] = 0
+        else:
+            self.failures[name] += 1
+            self._failure_streak[name] += 1
+
+    @contextmanager
+    def timed(self, name):
+        """Times the block; waits that raise (e.g. time out) are recorded as failures."""
+        start = time.perf_counter()
+        ok = False
+        try:
+            yield
+            ok = True
+        finally:
+            self.record(name, time.perf_counter() - start, ok)
+
+    def report(self):
+        lines = [f"{'wait':<32} {'count':>5} {'failed':>6} {'mean s':>8} {'max s':>8}"]
+        for name, durations in self.samples.items():
+            lines.append(f"{name:<32} {len(durations):>5} {self.failures.get(name, 0):>6} "
+                         f"{sum(durations) / len(durations):>8.3f} {max(durations):>8.3f}")
+        return "\n".join(lines)
+
+
+# Shared by every flow in the process unless one passes its own
+WAIT_STATS = WaitStats()
+
+
+# -------------------------- Selenium --------------------------
+def wait_until(driver, condition, name, stats=WAIT_STATS, poll=0.1):
+    """WebDriverWait.until with a timed, adaptive timeout and a short poll interval."""
+    from selenium.webdriver.support.ui import WebDriverWait
+
+    with stats.timed(name):
+        return WebDriverWait(driver, stats.timeout(name), poll_frequency=poll).until(
+            condition, message=f"Timed out waiting for {name}"
+        )
+
+
+def element_count_changed(locator, old_count):
+    """Selenium condition: the number of elements matching locator differs from old_count."""
+    def condition(driver):
+        return len(driver.find_elements(*locator)) != old_count
+    return condition
+
+
+# -------------------------- Playwright --------------------------
+async def pw_wait_for_selector(page, selector, name, state="visible", stats=WAIT_STATS):
+    with stats.timed(name):
+        return await page.wait_for_selector(selector, state=state, timeout=stats.timeout(name) * 1000)
+
+
+async def pw_wait_for_count_change(page, selector, old_count, name, stats=WAIT_STATS):
+    """Waits until the number of elements matching selector differs from old_count."""
+    with stats.timed(name):
+        await page.wait_for_function(
+            "([selector, n]) => document.querySelectorAll(selector).length !== n",
+            arg=[selector, old_count],
+            timeout=stats.timeout(name) * 1000,
+        )
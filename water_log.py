@@ -1,15 +1,18 @@
 # water_tracker.py
-import sqlite3
 from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 
+from unit_converter import convert, parse_quantity
+from user_store import connect
+
 DB_NAME = "water_intake.db"
 DAILY_GOAL = 3000  # 3 liters = 3000 ml
 
 # -------------------------- Database Setup --------------------------
-def create_table():
-    conn = sqlite3.connect(DB_NAME)
+def create_table(user_id=None):
+    conn = connect(DB_NAME, user_id)
     c = conn.cursor()
+    # Per-day totals, one row per date
     c.execute("""
         CREATE TABLE IF NOT EXISTS water (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -17,37 +20,59 @@ def create_table():
             amount INTEGER
         )
     """)
+    # Append-only log of every intake, used for intraday breakdowns
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS water_events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            ts TEXT NOT NULL,
+            amount INTEGER NOT NULL
+        )
+    """)
+    c.execute("CREATE INDEX IF NOT EXISTS idx_water_events_ts ON water_events (ts)")
+
+    # Older databases may hold several rows for the same day; fold them into
+    # one before the unique index on date is created.
+    c.execute("""
+        UPDATE water SET amount = (
+            SELECT SUM(w.amount) FROM water w WHERE w.date = water.date
+        )
+        WHERE id IN (SELECT MIN(id) FROM water GROUP BY date HAVING COUNT(*) > 1)
+    """)
+    c.execute("DELETE FROM water WHERE id NOT IN (SELECT MIN(id) FROM water GROUP BY date)")
+    c.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_water_date ON water (date)")
+
     conn.commit()
     conn.close()
 
 # -------------------------- Core Functions --------------------------
-def log_water(amount_ml):
-    """Logs water in ml for the current day."""
-    today = datetime.now().strftime("%Y-%m-%d")
-    conn = sqlite3.connect(DB_NAME)
+def log_water(amount_ml, user_id=None):
+    """Logs water in ml for the current day and returns the new daily total."""
+    now = datetime.now()
+    today = now.strftime("%Y-%m-%d")
+    conn = connect(DB_NAME, user_id)
     c = conn.cursor()
 
-    # Check if entry already exists for today
-    c.execute("SELECT amount FROM water WHERE date = ?", (today,))
-    row = c.fetchone()
-
-    # Update or Insert
-    if row:
-        new_amount = row[0] + amount_ml
-        c.execute("UPDATE water SET amount = ? WHERE date = ?", (new_amount, today))
-    else:
-        c.execute("INSERT INTO water (date, amount) VALUES (?, ?)", (today, amount_ml))
+    # Record the event and bump the daily total in a single transaction;
+    # the upsert on the unique date key avoids a read-modify-write race.
+    c.execute("INSERT INTO water_events (ts, amount) VALUES (?, ?)",
+              (now.strftime("%Y-%m-%d %H:%M:%S"), amount_ml))
+    c.execute("""
+        INSERT INTO water (date, amount) VALUES (?, ?)
+        ON CONFLICT(date) DO UPDATE SET amount = amount + excluded.amount
+        RETURNING amount
+    """, (today, amount_ml))
+    total = c.fetchone()[0]
 
     conn.commit()
     conn.close()
 
-    return new_amount if row else amount_ml
+    return total
 
 
-def get_today_progress():
+def get_today_progress(user_id=None):
     """Returns today's water intake."""
     today = datetime.now().strftime("%Y-%m-%d")
-    conn = sqlite3.connect(DB_NAME)
+    conn = connect(DB_NAME, user_id)
     c = conn.cursor()
     c.execute("SELECT amount FROM water WHERE date = ?", (today,))
     row = c.fetchone()
@@ -55,9 +80,9 @@ def get_today_progress():
     return row[0] if row else 0
 
 
-def get_last_7_days():
+def get_last_7_days(user_id=None):
     """Fetch last 7 days of data."""
-    conn = sqlite3.connect(DB_NAME)
+    conn = connect(DB_NAME, user_id)
     c = conn.cursor()
     start_date = (datetime.now() - timedelta(days=6)).strftime("%Y-%m-%d")
     c.execute("""
@@ -70,9 +95,28 @@ def get_last_7_days():
     return rows
 
 
+def get_hourly_breakdown(date=None, user_id=None):
+    """Returns [(hour, amount), ...] of intake for a day (default: today)."""
+    if not date:
+        date = datetime.now().strftime("%Y-%m-%d")
+    next_day = (datetime.strptime(date, "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+    conn = connect(DB_NAME, user_id)
+    c = conn.cursor()
+    c.execute("""
+        SELECT CAST(strftime('%H', ts) AS INTEGER) AS hour, SUM(amount)
+        FROM water_events
+        WHERE ts >= ? AND ts < ?
+        GROUP BY hour
+        ORDER BY hour
+    """, (date, next_day))
+    rows = c.fetchall()
+    conn.close()
+    return rows
+
+
 # -------------------------- Plot Chart --------------------------
-def plot_weekly_hydration():
-    data = get_last_7_days()
+def plot_weekly_hydration(user_id=None):
+    data = get_last_7_days(user_id)
 
     if not data:
         print("No hydration data for the last 7 days.")
@@ -94,35 +138,47 @@ def plot_weekly_hydration():
 
 # -------------------------- Main Menu --------------------------
 def main():
-    create_table()
+    user_id = input("Enter your user name (leave blank for the shared log): ").strip() or None
+    create_table(user_id)
 
     while True:
         print("\n====== WATER INTAKE TRACKER ======")
         print("1. Log water intake")
         print("2. Show today's progress")
         print("3. Show weekly hydration chart")
-        print("4. Exit")
+        print("4. Show today's hourly breakdown")
+        print("5. Exit")
 
-        choice = input("\nSelect an option (1–4): ")
+        choice = input("\nSelect an option (1–5): ")
 
         if choice == "1":
             try:
-                amount = int(input("Enter water amount (ml): "))
-                total = log_water(amount)
+                value, unit = parse_quantity(input("Enter water amount (e.g. 500, 500 ml, 16 oz): "), "ml")
+                # For drinks, "oz" means fluid ounces
+                unit = "fl_oz" if unit == "oz" else unit
+                amount = round(convert(value, unit, "ml", food="water"))
+                total = log_water(amount, user_id)
                 progress = (total / DAILY_GOAL) * 100
                 print(f"\nAdded {amount} ml! Today's total: {total} ml ({progress:.1f}% of goal).")
             except ValueError:
-                print("Invalid input. Please enter a number.")
+                print("Invalid input. Please enter a number, optionally followed by a unit.")
 
         elif choice == "2":
-            total = get_today_progress()
+            total = get_today_progress(user_id)
             progress = (total / DAILY_GOAL) * 100
             print(f"\nToday's intake: {total} ml ({progress:.1f}% of 3L goal).")
 
         elif choice == "3":
-            plot_weekly_hydration()
+            plot_weekly_hydration(user_id)
 
         elif choice == "4":
+            rows = get_hourly_breakdown(user_id=user_id)
+            if not rows:
+                print("\nNo water logged today yet.")
+            for hour, amount in rows:
+                print(f"  {hour:02d}:00  {amount} ml")
+
+        elif choice == "5":
             print("Goodbye! Stay hydrated 💧")
             break
 
@@ -1,28 +1,38 @@
 # send_whatsapp_web.py
+# Sends one message to a chat you pick by hand; for batches use whatsapp_queue.py
 import webbrowser
 import pyautogui
-import time
+
+from rpa_helpers import TEMPLATE_DIR, ScreenLocator
 
 pyautogui.FAILSAFE = True  # move mouse to top-left to abort
 
 message = "hi guys have a good day"
 
+# Screenshots of the WhatsApp Web search box and message box; capture your own
+# with rpa_helpers.capture_template (use mousepointerfinder.py to find the region).
+# Until they exist the script falls back to the old fixed waits.
+SEARCH_BOX = f"{TEMPLATE_DIR}/whatsapp_search.png"
+MESSAGE_BOX = f"{TEMPLATE_DIR}/whatsapp_message_box.png"
+
+screen = ScreenLocator(poll_interval=0.25)
+
 # Open WhatsApp Web
 webbrowser.open("https://web.whatsapp.com")
-print("Opening WhatsApp Web... give the page time to load and (if needed) scan QR code.")
-time.sleep(10)   # increase if your internet is slow or you need time to scan QR
+print("Opening WhatsApp Web... waiting for it to load (scan the QR code if asked).")
+screen.wait_for(SEARCH_BOX, timeout=120, fallback_sleep=10)   # long enough to scan a QR code
 
 # ====== IMPORTANT ======
 # At this point: manually click the chat you want to send the message to.
-# Alternatively, if the chat is already visible and selected, script will type directly.
+# The script continues as soon as the chat's message box is visible.
 # =======================
 
-print("Please click the chat window now. Script will type message in 5 seconds...")
-time.sleep(5)
+print("Please click the chat window now. Script will type as soon as the message box shows up...")
+box = screen.click(MESSAGE_BOX, timeout=60, fallback_sleep=5)
 
 # Type the message and send
 pyautogui.typewrite(message)
-time.sleep(0.2)
 pyautogui.press('enter')
 
-print("Message sent (if the chat was selected).")
+# Without the template nothing confirmed that a chat was open
+print("Message sent." if box else "Message sent (if the chat was selected).")
@@ -0,0 +1,241 @@
+# whatsapp_queue.py
+"""
+Batched WhatsApp Web sender.
+
+Jobs (chat, message, send_at) are queued in SQLite and drained through one
+Playwright browser session: each chat is opened via the search box, the
+message is typed and sent, and failures are retried with backoff.
+"""
+import argparse
+import asyncio
+import csv
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+from playwright.async_api import async_playwright
+
+from wait_helpers import WAIT_STATS, pw_wait_for_count_change, pw_wait_for_selector
+
+DB_NAME = "whatsapp_queue.db"
+BASE_URL = "https://web.whatsapp.com"
+
+# WhatsApp Web selectors; a local stub page only needs to provide the same ones
+SEARCH_BOX = 'div[contenteditable="true"][data-tab="3"]'
+MESSAGE_BOX = 'footer div[contenteditable="true"]'
+CHAT_HEADER = "#main header"
+SENT_MESSAGE = "#main div.message-out"
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Also accepted for send_at; everything is stored as TIME_FORMAT so it sorts correctly
+INPUT_FORMATS = (TIME_FORMAT, "%Y-%m-%d %H:%M", "%Y-%m-%d")
+
+
+# -------------------------- Queue Storage --------------------------
+def create_table(db_name=DB_NAME):
+    conn = sqlite3.connect(db_name)
+    c = conn.cursor()
+    c.execute("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            chat TEXT NOT NULL,
+            message TEXT NOT NULL,
+            send_at TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending',
+            attempts INTEGER NOT NULL DEFAULT 0,
+            last_error TEXT,
+            sent_at TEXT
+        )
+    """)
+    c.execute("CREATE INDEX IF NOT EXISTS idx_jobs_due ON jobs (status, send_at)")
+    conn.commit()
+    conn.close()
+
+
+def parse_send_at(value):
+    """Normalizes a send_at string (TIME_FORMAT, without seconds, or ISO 8601) to TIME_FORMAT."""
+    value = value.strip()
+    for fmt in INPUT_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).strftime(TIME_FORMAT)
+        except ValueError:
+            pass
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"invalid send_at {value!r}; expected YYYY-MM-DD HH:MM[:SS]") from None
+    if parsed.tzinfo:
+        # Queue times are local, like datetime.now() in next_job
+        parsed = parsed.astimezone().replace(tzinfo=None)
+    return parsed.strftime(TIME_FORMAT)
+
+
+def enqueue(chat, message, send_at=None, db_name=DB_NAME):
+    send_at = parse_send_at(send_at) if send_at else datetime.now().strftime(TIME_FORMAT)
+    conn = sqlite3.connect(db_name)
+    conn.execute("INSERT INTO jobs (chat, message, send_at) VALUES (?, ?, ?)", (chat, message, send_at))
+    conn.commit()
+    conn.close()
+
+
+def load_jobs_from_csv(path, db_name=DB_NAME):
+    """
+    Queues every row of a CSV with columns chat, message and optional send_at.
+
+    Nothing is queued if any row is invalid; the ValueError names the line.
+    """
+    now = datetime.now().strftime(TIME_FORMAT)
+    rows = []
+    with open(path, newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        for r in reader:
+            try:
+                if not r.get("chat") or not r.get("message"):
+                    raise ValueError("chat and message are required")
+                send_at = parse_send_at(r["send_at"]) if r.get("send_at") else now
+            except ValueError as e:
+                raise ValueError(f"{path} line {reader.line_num}: {e}") from None
+            rows.append((r["chat"], r["message"], send_at))
+    conn = sqlite3.connect(db_name)
+    conn.executemany("INSERT INTO jobs (chat, message, send_at) VALUES (?, ?, ?)", rows)
+    conn.commit()
+    conn.close()
+    return len(rows)
+
+
+def next_job(db_name=DB_NAME):
+    """Returns (due_job, next_send_at): the oldest due job, or when the next one is due."""
+    now = datetime.now().strftime(TIME_FORMAT)
+    conn = sqlite3.connect(db_name)
+    c = conn.cursor()
+    c.execute("""
+        SELECT id, chat, message, attempts FROM jobs
+        WHERE status = 'pending' AND send_at <= ?
+        ORDER BY send_at, id LIMIT 1
+    """, (now,))
+    job = c.fetchone()
+    c.execute("SELECT MIN(send_at) FROM jobs WHERE status = 'pending'")
+    upcoming = c.fetchone()[0]
+    conn.close()
+    return job, upcoming
+
+
+def mark_sent(job_id, db_name=DB_NAME):
+    conn = sqlite3.connect(db_name)
+    conn.execute("UPDATE jobs SET status = 'sent', sent_at = ? WHERE id = ?",
+                 (datetime.now().strftime(TIME_FORMAT), job_id))
+    conn.commit()
+    conn.close()
+
+
+def mark_failed(job_id, attempts, error, max_attempts, db_name=DB_NAME, retry_delay=5):
+    """Reschedules the job after retry_delay x 2^attempts seconds, or gives up after max_attempts."""
+    attempts += 1
+    retry_at = (datetime.now() + timedelta(seconds=retry_delay * 2 ** attempts)).strftime(TIME_FORMAT)
+    status = "failed" if attempts >= max_attempts else "pending"
+    conn = sqlite3.connect(db_name)
+    conn.execute("UPDATE jobs SET status = ?, attempts = ?, last_error = ?, send_at = ? WHERE id = ?",
+                 (status, attempts, error, retry_at, job_id))
+    conn.commit()
+    conn.close()
+
+
+# -------------------------- Sending --------------------------
+async def send_message(page, chat, message, stats=WAIT_STATS):
+    """Opens chat through the search box and sends message."""
+    search = await pw_wait_for_selector(page, SEARCH_BOX, "whatsapp search box", stats=stats)
+    await search.click()
+    await search.fill(chat)
+    await search.press("Enter")
+
+    # The chat is open once its name shows in the conversation header
+    with stats.timed("whatsapp chat open"):
+        await page.locator(CHAT_HEADER).get_by_text(chat, exact=True).first.wait_for(
+            timeout=stats.timeout("whatsapp chat open") * 1000
+        )
+    box = await pw_wait_for_selector(page, MESSAGE_BOX, "whatsapp message box", stats=stats)
+    sent_before = await page.locator(SENT_MESSAGE).count()
+    await box.fill(message)
+    await box.press("Enter")
+
+    # Sent once the new outgoing bubble shows up in the conversation
+    await pw_wait_for_count_change(page, SENT_MESSAGE, sent_before, "whatsapp message sent", stats=stats)
+
+
+async def drain_queue(db_name=DB_NAME, base_url=BASE_URL, per_minute=20, max_attempts=3,
+                      headless=False, user_data_dir="./whatsapp_user_data", login_timeout=120,
+                      retry_delay=5, stats=WAIT_STATS):
+    """
+    Sends every pending job through one browser session; returns (sent, failed).
+
+    Failed jobs are retried after retry_delay x 2^attempts seconds; stats holds
+    the adaptive timeouts of the waits inside send_message.
+    """
+    if per_minute <= 0:
+        raise ValueError("per_minute must be positive")
+    create_table(db_name)
+    min_interval = 60.0 / per_minute
+    sent = failed = 0
+
+    async with async_playwright() as p:
+        # Persistent profile keeps the WhatsApp login between runs
+        context = await p.chromium.launch_persistent_context(user_data_dir=user_data_dir, headless=headless)
+        page = await context.new_page()
+        await page.goto(base_url, wait_until="domcontentloaded")
+        print("Waiting for WhatsApp Web (scan the QR code if asked)...")
+        await page.wait_for_selector(SEARCH_BOX, timeout=login_timeout * 1000)
+
+        last_send = 0.0
+        while True:
+            job, upcoming = next_job(db_name)
+            if not job:
+                if not upcoming:
+                    break
+                # Nothing due yet; sleep until the next scheduled job (at most 30 s at a time)
+                due = datetime.strptime(upcoming, TIME_FORMAT)
+                await asyncio.sleep(min(30.0, max(0.5, (due - datetime.now()).total_seconds())))
+                continue
+
+            # Rate limiting: keep at least min_interval between messages
+            wait = last_send + min_interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+
+            job_id, chat, message, attempts = job
+            try:
+                await send_message(page, chat, message, stats)
+                mark_sent(job_id, db_name)
+                sent += 1
+                print(f"✅ Sent to {chat}")
+            except Exception as e:
+                mark_failed(job_id, attempts, f"{type(e).__name__}: {e}", max_attempts, db_name, retry_delay)
+                if attempts + 1 >= max_attempts:
+                    failed += 1
+                print(f"⚠️ Could not send to {chat} (attempt {attempts + 1}): {e}")
+            last_send = time.monotonic()
+
+        await context.close()
+
+    return sent, failed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Send queued WhatsApp Web messages.")
+    parser.add_argument("jobs_csv", nargs="?", help="CSV with chat, message[, send_at] columns to queue first")
+    parser.add_argument("--db", default=DB_NAME)
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--per-minute", type=float, default=20, help="send rate limit (> 0)")
+    parser.add_argument("--headless", action="store_true")
+    args = parser.parse_args()
+    if args.per_minute <= 0:
+        parser.error("--per-minute must be positive")
+
+    create_table(args.db)
+    if args.jobs_csv:
+        print(f"Queued {load_jobs_from_csv(args.jobs_csv, args.db)} messages.")
+
+    start = time.monotonic()
+    sent, failed = asyncio.run(drain_queue(args.db, args.base_url, args.per_minute, headless=args.headless))
+    minutes = (time.monotonic() - start) / 60
+    print(f"\n🎯 Sent {sent}, failed {failed} in {minutes:.1f} min ({sent / max(minutes, 1e-9):.1f} msg/min)")
+    print(WAIT_STATS.report())